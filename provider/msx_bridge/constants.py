@@ -45,3 +45,26 @@ PLAYER_ID_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_]+")
 # Pre-buffer size: accumulate this many bytes before sending HTTP headers to prevent
 # MSX stutter/restart when ffmpeg hasn't produced data yet.
 PRE_BUFFER_BYTES = 64 * 1024
+
+# Maximum shortfall (bytes) vs the estimated Content-Length that is padded at the
+# end of a stream; larger gaps close the connection instead. ~5s @ 40KB/s MP3.
+MAX_PAD_BYTES = 200 * 1024
+
+# Seconds an encoded library list response (/api and MSX list pages) is served
+# from cache (also invalidated on MA library add/update/delete events)
+LIST_CACHE_TTL = 30
+
+# Cached list responses kept before the cache is reset (MSX pages vary by host
+# and device, so the key space is open-ended)
+LIST_CACHE_MAX_ENTRIES = 256
+
+# Seconds a queue item's resolved duration is reused when a stream is reopened
+DURATION_CACHE_TTL = 5
+
+# Player poll intervals (seconds): the first POLL_GREEDY_COUNT polls after a
+# playback state change use the short interval, steady state the long one
+POLL_GREEDY_COUNT = 3
+POLL_INTERVAL_PLAYING = 5
+POLL_INTERVAL_PLAYING_STEADY = 30
+POLL_INTERVAL_IDLE = 30
+POLL_INTERVAL_IDLE_STEADY = 60
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
+import hashlib
 import logging
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 from urllib.parse import quote
+from weakref import WeakSet
 
-from aiohttp import web
-from music_assistant_models.enums import ContentType
+import orjson
+from aiohttp import WSMsgType, web
+from multidict import CIMultiDict, CIMultiDictProxy
+from music_assistant_models.enums import ContentType, EventType
 from music_assistant_models.media_items import AudioFormat
 
 from music_assistant.helpers.ffmpeg import get_ffmpeg_stream
@@ -26,6 +31,10 @@ from .constants import (
     DEFAULT_MSX_KIOSK_MODE,
     DEFAULT_SENDSPIN_ENABLED,
     DEFAULT_SHOW_STOP_NOTIFICATION,
+    DURATION_CACHE_TTL,
+    LIST_CACHE_MAX_ENTRIES,
+    LIST_CACHE_TTL,
+    MAX_PAD_BYTES,
     MSX_KIOSK_MODE_DISABLED,
     MSX_KIOSK_MODE_SENDSPIN,
     MSX_KIOSK_MODE_STANDARD,
@@ -46,7 +55,10 @@ from .models import MsxContent, MsxItem, MsxTemplate
 from .player import MSXPlayer
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from multidict import MultiMapping
+    from music_assistant_models.event import MassEvent
 
     from .provider import MSXBridgeProvider
 
@@ -56,17 +68,178 @@ STATIC_DIR = Path(__file__).parent / "static"
 
 _KNOWN_EXTENSIONS = (".mp3", ".json", ".flac", ".aac")
 
+# output_format -> (codec, MIME type, estimated bytes/s for Content-Length).
+# FLAC has no fixed bitrate, so no Content-Length is sent for it.
+_OUTPUT_FORMATS: Final[dict[str, tuple[ContentType, str, int]]] = {
+    "mp3": (ContentType.MP3, "audio/mpeg", 40_000),
+    "aac": (ContentType.AAC, "audio/aac", 32_000),
+    "flac": (ContentType.FLAC, "audio/flac", 0),
+}
+# Unknown formats are encoded as MP3 but, as before, sent without Content-Length
+_DEFAULT_OUTPUT_FORMAT: Final = (ContentType.MP3, "audio/mpeg", 0)
+
+# Read-only audio response headers per MIME type; StreamResponse copies them,
+# and Content-Length is set separately via StreamResponse.content_length.
+_STREAM_HEADERS: Final[dict[str, CIMultiDictProxy[str]]] = {
+    mime_type: CIMultiDictProxy(
+        CIMultiDict(
+            {
+                "Content-Type": mime_type,
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "Accept-Ranges": "none",
+            }
+        )
+    )
+    for _, mime_type, _ in (*_OUTPUT_FORMATS.values(), _DEFAULT_OUTPUT_FORMAT)
+}
+
+# MSX page templates shared by the content handlers (never mutated)
+_TPL_MENU: Final = MsxTemplate(
+    type="separate",
+    layout="0,0,2,4",
+    icon="msx-white-soft:music-note",
+    action="content:{context:content}",
+)
+_TPL_SEARCH_PAGE: Final = MsxTemplate(type="separate", layout="0,0,2,4")
+_TPL_ALBUM_GRID: Final = MsxTemplate(
+    type="separate", layout="0,0,3,4", color="msx-glass"
+)
+_TPL_ARTIST_GRID: Final = MsxTemplate(
+    type="separate", layout="0,0,2,3", color="msx-glass"
+)
+_TPL_TRACK_LIST: Final = MsxTemplate(
+    type="default", layout="0,0,6,1", image_width=0.83, color="msx-glass"
+)
+_TPL_ALBUM_LIST: Final = MsxTemplate(
+    type="default", layout="0,0,6,2", image_width=1.5, color="msx-glass"
+)
+_TPL_SEARCH_RESULTS: Final = MsxTemplate(
+    type="separate", layout="0,0,2,4", image_filler="default"
+)
+
+# Vendored TVX libraries only change with a plugin release; clients revalidate
+# them by ETag (FileResponse) once a day
+_VENDOR_CACHE_CONTROL: Final = "public, max-age=86400"
+
+# Static <head> of the status dashboard; only the body depends on the request
+_DASHBOARD_HEAD: Final = """<!DOCTYPE html>
+<html>
+<head><title>MSX Bridge</title>
+<style>
+body { font-family: system-ui, sans-serif; max-width: 800px; margin: 50px auto; padding: 20px; }
+.info { background: #e3f2fd; padding: 15px; border-radius: 5px; margin: 10px 0; }
+.info-sendspin { background: #e8f5e9; }
+code { background: #f5f5f5; padding: 2px 6px; border-radius: 3px; word-break: break-all; }
+.player-row { display: flex; align-items: center; gap: 12px; margin: 8px 0; list-style: none; }
+.player-row form { margin: 0; }
+.btn { padding: 6px 12px; border-radius: 4px; border: 1px solid #1976d2;
+  background: #1976d2; color: white; cursor: pointer; font-size: 14px; }
+.btn:hover { background: #1565c0; }
+.link-row { margin: 8px 0; }
+.link-row a { color: #1976d2; text-decoration: none; }
+.link-row a:hover { text-decoration: underline; }
+small { color: #666; display: block; margin-top: 4px; }
+</style>
+</head>
+"""
+
+# CORS preflight answer for every path; Response copies these per request
+_CORS_PREFLIGHT_HEADERS: Final = CIMultiDictProxy(
+    CIMultiDict(
+        {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+            "Access-Control-Allow-Headers": "*",
+        }
+    )
+)
+
+# Headers for generated HTML the TV must always refetch
+_NO_STORE_HEADERS: Final = CIMultiDictProxy(
+    CIMultiDict(
+        {
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0",
+        }
+    )
+)
+
+# Fixed WebSocket commands, encoded once
+_PAUSE_MSG: Final = orjson.dumps({"type": "pause"}).decode()
+_RESUME_MSG: Final = orjson.dumps({"type": "resume"}).decode()
+
+# Body of every successful playback control call
+_STATUS_OK_BODY: Final = orjson.dumps({"status": "ok"})
+
+# Bound once: player_id derivation runs on every MSX request
+_sanitize_id = PLAYER_ID_SANITIZE_RE.sub
+
+# Zero-filled block used to pad a sized body when ffmpeg under-produces
+_PAD_CHUNK = bytes(64 * 1024)
+
 
 def _int_param(
     query: MultiMapping[str], name: str, default: int, max_val: int = 10000
 ) -> int:
     """Parse an integer query parameter safely, clamping to [0, max_val]."""
+    value = query.get(name)
+    if value is None:
+        return default
     try:
-        return max(0, min(int(query.get(name, str(default))), max_val))
-    except (ValueError, TypeError):
+        return max(0, min(int(value), max_val))
+    except ValueError:
         return default
 
 
+def _page_params(query: MultiMapping[str], default_limit: int = 50) -> tuple[int, int]:
+    """Return the clamped (limit, offset) paging parameters of a list request."""
+    return _int_param(query, "limit", default_limit), _int_param(query, "offset", 0)
+
+
+def _result_total(result: Any) -> int:
+    """Return the library total of a list result (paged items carry ``total``)."""
+    total = getattr(result, "total", None)
+    return len(result) if total is None else total
+
+
+def _json_response(data: Any, status: int = 200) -> web.Response:
+    """Return a JSON response encoded with orjson (bytes body, no re-encode)."""
+    return web.Response(
+        body=orjson.dumps(data), status=status, content_type="application/json"
+    )
+
+
+def _ok_response() -> web.Response:
+    """Return the fixed ``{"status": "ok"}`` reply of the control endpoints."""
+    return web.Response(body=_STATUS_OK_BODY, content_type="application/json")
+
+
+def _msx_body(content: MsxContent) -> bytes:
+    """Serialize an MSX page by pydantic straight to JSON bytes (no dict pass)."""
+    return content.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def _msx_response(content: MsxContent) -> web.Response:
+    """Return an MSX page as a JSON response."""
+    return web.Response(body=_msx_body(content), content_type="application/json")
+
+
+def _body_etag(body: bytes) -> str:
+    """Return a short strong ETag for an encoded response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _list_response(request: web.Request, body: bytes, etag: str) -> web.Response:
+    """Return an encoded list, or 304 when the client already holds this ETag."""
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304, headers={"ETag": etag})
+    return web.Response(
+        body=body, content_type="application/json", headers={"ETag": etag}
+    )
+
+
 def _strip_known_extension(value: str) -> str:
     """Strip only known audio/data extensions from a value."""
     for ext in _KNOWN_EXTENSIONS:
@@ -92,6 +265,80 @@ def _sort_album_tracks(tracks: list[Any]) -> list[Any]:
     )
 
 
+def _drain_ready(
+    queue: asyncio.Queue[bytes | None], first: bytes
+) -> tuple[bytes, bool]:
+    """Join ``first`` with the chunks already waiting in ``queue``.
+
+    Returns the joined bytes and whether the end-of-stream sentinel was taken.
+    """
+    if queue.empty():
+        return first, False
+    parts = [first]
+    while not queue.empty():
+        nxt = queue.get_nowait()
+        if nxt is None:
+            return b"".join(parts), True
+        parts.append(nxt)
+    return b"".join(parts), False
+
+
+def _safe_abort(transport: Any) -> None:
+    """Abort a stream's transport, ignoring ones without abort() or already gone."""
+    abort = getattr(transport, "abort", None)
+    if abort is not None:
+        with contextlib.suppress(Exception):
+            abort()
+
+
+@dataclass(slots=True)
+class _ApiItem:
+    """Library entry of the /api JSON responses (encoded natively by orjson)."""
+
+    item_id: str
+    name: str
+    image: str | None
+    uri: str
+
+    @classmethod
+    def from_media(cls, item: Any, provider: MSXBridgeProvider) -> _ApiItem:
+        """Build the entry for an MA artist or playlist."""
+        return cls(
+            str(item.item_id), item.name, get_image_url(item, provider), item.uri
+        )
+
+
+@dataclass(slots=True)
+class _ApiAlbum(_ApiItem):
+    """Album entry of the /api JSON responses."""
+
+    artist: str = ""
+
+    @classmethod
+    def from_media(cls, item: Any, provider: MSXBridgeProvider) -> _ApiAlbum:
+        """Build the entry for an MA album."""
+        return cls(
+            str(item.item_id),
+            item.name,
+            get_image_url(item, provider),
+            item.uri,
+            getattr(item, "artist_str", ""),
+        )
+
+
+@dataclass(slots=True)
+class _PlayerConnections:
+    """Live connections of one player: WebSocket clients and audio streams.
+
+    WebSocket clients are held weakly so a client that died without running
+    its cleanup does not stay referenced (and iterated on broadcast).
+    """
+
+    ws: WeakSet[web.WebSocketResponse] = field(default_factory=WeakSet)
+    tasks: set[asyncio.Task[None]] = field(default_factory=set)
+    transports: set[Any] = field(default_factory=set)
+
+
 class MSXHTTPServer:
     """HTTP server that serves MSX bootstrap, library API, and stream proxy."""
 
@@ -101,9 +348,14 @@ class MSXHTTPServer:
         self.port = port
         self.app = web.Application(middlewares=[self._cors_middleware])
         self._runner: web.AppRunner | None = None
-        self._ws_clients: dict[str, set[web.WebSocketResponse]] = {}
-        self._active_stream_tasks: dict[str, set[asyncio.Task[None]]] = {}
-        self._active_stream_transports: dict[str, set[Any]] = {}
+        self._connections: dict[str, _PlayerConnections] = {}
+        # (endpoint, [host, device...,] limit, offset) -> (timestamp, body, ETag)
+        self._list_cache: dict[tuple[Any, ...], tuple[float, bytes, str]] = {}
+        self._duration_cache: dict[tuple[str, str], tuple[float, int, int]] = {}
+        # Provider config changes reload the provider, so these never go stale
+        self._stop_msg: str | None = None
+        self._plugin_html: dict[tuple[str, bool], bytes] = {}
+        self._unsub_library_events: Callable[[], None] | None = None
         self._setup_routes()
 
     def _get_sendspin_settings(self, request: web.Request) -> tuple[bool, str]:
@@ -125,10 +377,11 @@ class MSXHTTPServer:
         self.app.router.add_get("/msx/plugin.html", self._handle_msx_plugin_html)
         self.app.router.add_get(
             "/msx/tvx-plugin-module.min.js",
-            self._serve_static("tvx-plugin-module.min.js"),
+            self._serve_static("tvx-plugin-module.min.js", _VENDOR_CACHE_CONTROL),
         )
         self.app.router.add_get(
-            "/msx/tvx-plugin.min.js", self._serve_static("tvx-plugin.min.js")
+            "/msx/tvx-plugin.min.js",
+            self._serve_static("tvx-plugin.min.js", _VENDOR_CACHE_CONTROL),
         )
         self.app.router.add_get("/msx/input.html", self._handle_msx_input_html)
         self.app.router.add_get("/msx/input.js", self._serve_static("input.js"))
@@ -249,15 +502,13 @@ class MSXHTTPServer:
     async def _cors_middleware(
         self, request: web.Request, handler: Any
     ) -> web.StreamResponse:
-        """Add CORS headers to all responses."""
+        """Add CORS headers to all responses.
+
+        Preflights are answered here rather than by an OPTIONS route so they
+        never reach the ``*`` method control endpoints (pause/stop/next...).
+        """
         if request.method == "OPTIONS":
-            return web.Response(
-                headers={
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-                    "Access-Control-Allow-Headers": "*",
-                }
-            )
+            return web.Response(headers=_CORS_PREFLIGHT_HEADERS)
         response: web.StreamResponse = await handler(request)
         response.headers["Access-Control-Allow-Origin"] = "*"
         return response
@@ -275,15 +526,28 @@ class MSXHTTPServer:
             reuse_port=True,
         )
         await site.start()
+        self._unsub_library_events = self.provider.mass.subscribe(
+            self._on_library_event,
+            (
+                EventType.MEDIA_ITEM_ADDED,
+                EventType.MEDIA_ITEM_UPDATED,
+                EventType.MEDIA_ITEM_DELETED,
+            ),
+        )
         logger.info("MSX Bridge HTTP server started on port %s", self.port)
 
     async def stop(self) -> None:
         """Stop the HTTP server."""
-        for clients in self._ws_clients.values():
-            for ws in clients:
+        if self._unsub_library_events:
+            self._unsub_library_events()
+            self._unsub_library_events = None
+        self._list_cache.clear()
+        self._duration_cache.clear()
+        for conns in self._connections.values():
+            for ws in list(conns.ws):
                 if not ws.closed:
                     await ws.close()
-        self._ws_clients.clear()
+        self._connections.clear()
         if self._runner:
             await self._runner.cleanup()
             self._runner = None
@@ -295,14 +559,16 @@ class MSXHTTPServer:
         """Serve status dashboard."""
         players = self.provider.players
         base = f"http://{request.host}"
-        player_rows = []
-        for p in players:
-            row = f'<li class="player-row"><span>{p.display_name} — {p.playback_state.value}</span>'
-            row += f'<form method="post" action="{base}/api/quick-stop/{p.player_id}" '
-            row += 'style="display:inline">'
-            row += '<button type="submit" class="btn">Quick stop</button></form></li>'
-            player_rows.append(row)
-        player_info = "".join(player_rows) if player_rows else ""
+        player_info = "".join(
+            [
+                f'<li class="player-row"><span>{p.display_name} — '
+                f"{p.playback_state.value}</span>"
+                f'<form method="post" action="{base}/api/quick-stop/{p.player_id}" '
+                'style="display:inline">'
+                '<button type="submit" class="btn">Quick stop</button></form></li>'
+                for p in players
+            ]
+        )
 
         # Build Sendspin URL (Sendspin server port 8927)
         host_parts = request.host.split(":")
@@ -312,26 +578,7 @@ class MSXHTTPServer:
         sendspin_web_url = f"{base}/web?sendspin_url={quote(sendspin_url, safe='')}"
         sendspin_kiosk_url = f"{sendspin_web_url}&kiosk=1"
 
-        html = f"""<!DOCTYPE html>
-<html>
-<head><title>MSX Bridge</title>
-<style>
-body {{ font-family: system-ui, sans-serif; max-width: 800px; margin: 50px auto; padding: 20px; }}
-.info {{ background: #e3f2fd; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-.info-sendspin {{ background: #e8f5e9; }}
-code {{ background: #f5f5f5; padding: 2px 6px; border-radius: 3px; word-break: break-all; }}
-.player-row {{ display: flex; align-items: center; gap: 12px; margin: 8px 0; list-style: none; }}
-.player-row form {{ margin: 0; }}
-.btn {{ padding: 6px 12px; border-radius: 4px; border: 1px solid #1976d2;
-  background: #1976d2; color: white; cursor: pointer; font-size: 14px; }}
-.btn:hover {{ background: #1565c0; }}
-.link-row {{ margin: 8px 0; }}
-.link-row a {{ color: #1976d2; text-decoration: none; }}
-.link-row a:hover {{ text-decoration: underline; }}
-small {{ color: #666; display: block; margin-top: 4px; }}
-</style>
-</head>
-<body>
+        html = f"""{_DASHBOARD_HEAD}<body>
 <h1>MSX Music Assistant Bridge</h1>
 
 <div class="info">
@@ -369,7 +616,9 @@ small {{ color: #666; display: block; margin-top: 4px; }}
 </div>
 </body>
 </html>"""
-        return web.Response(text=html, content_type="text/html")
+        return web.Response(
+            body=html.encode(), content_type="text/html", charset="utf-8"
+        )
 
     async def _handle_start_json(self, request: web.Request) -> web.Response:
         """Return MSX start configuration."""
@@ -408,30 +657,50 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 "parameter": f"menu:request:interaction:init@{prefix}/msx/plugin.html?v=8&kiosk=1",
             }
 
-        return web.json_response(start_config)
+        return _json_response(start_config)
+
+    def _serve_static(self, filename: str, cache_control: str | None = None) -> Any:
+        """Create a handler that serves a static file from the static directory.
 
-    def _serve_static(self, filename: str) -> Any:
-        """Create a handler that serves a static file from the static directory."""
+        FileResponse answers If-None-Match/If-Modified-Since with 304 on its own;
+        ``cache_control`` additionally lets the client skip revalidation.
+        """
         path = STATIC_DIR / filename
+        headers = {"Cache-Control": cache_control} if cache_control else None
 
         async def handler(_request: web.Request) -> web.FileResponse:
-            return web.FileResponse(path)
+            return web.FileResponse(path, headers=headers)
 
         return handler
 
     async def _handle_msx_plugin_html(self, request: web.Request) -> web.Response:
         """Serve plugin.html with Sendspin settings injected."""
-        path = STATIC_DIR / "plugin.html"
-        content = path.read_text(encoding="utf-8")
-
         # Check if sendspin is forced via URL param (for kiosk sendspin mode)
         sendspin_forced = request.query.get("sendspin") == "1"
-        
+        host = request.host.split(":")[0]
+        content = self._plugin_html.get((host, sendspin_forced))
+        if content is None:
+            content = self._render_plugin_html(host, sendspin_forced)
+            # Keyed by the client-sent Host, so keep the cache bounded
+            if len(self._plugin_html) >= 16:
+                self._plugin_html.clear()
+            self._plugin_html[(host, sendspin_forced)] = content
+
+        return web.Response(
+            body=content,
+            content_type="text/html",
+            charset="utf-8",
+            headers=_NO_STORE_HEADERS,
+        )
+
+    def _render_plugin_html(self, host: str, sendspin_forced: bool) -> bytes:
+        """Render plugin.html for a host (config is fixed for the server lifetime)."""
+        content = (STATIC_DIR / "plugin.html").read_text(encoding="utf-8")
+
         # Inject Sendspin configuration
         sendspin_enabled = sendspin_forced or bool(
             self.provider.config.get_value(CONF_SENDSPIN_ENABLED, DEFAULT_SENDSPIN_ENABLED)
         )
-        host = request.host.split(":")[0]
         # Default Sendspin server URL (same host, port 8927)
         sendspin_server = f"http://{host}:8927"
 
@@ -440,20 +709,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             "var SENDSPIN_ENABLED = false;",
             f"var SENDSPIN_ENABLED = {str(sendspin_enabled).lower()};",
         )
-        content = content.replace(
+        return content.replace(
             'var SENDSPIN_SERVER = "";',
             f'var SENDSPIN_SERVER = "{sendspin_server}";',
-        )
-
-        return web.Response(
-            text=content,
-            content_type="text/html",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
-            },
-        )
+        ).encode()
 
     async def _handle_msx_input_html(self, request: web.Request) -> web.FileResponse:
         """Serve input.html and ensure player is registered when Search is opened."""
@@ -499,11 +758,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         return web.Response(
             text=content,
             content_type="text/html",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
-            },
+            headers=_NO_STORE_HEADERS,
         )
 
     async def _handle_web_app(self, request: web.Request) -> web.Response:
@@ -547,11 +802,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         return web.Response(
             text=content,
             content_type="text/html",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
-            },
+            headers=_NO_STORE_HEADERS,
         )
 
     async def _handle_kiosk_page(self, request: web.Request) -> web.Response:
@@ -564,7 +815,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 "layout": "0,0,12,6"
             }]
         }
-        return web.json_response(content)
+        return _json_response(content)
 
     async def _handle_kiosk_content(self, request: web.Request) -> web.Response:
         """Return MSX content page with fullscreen iframe for kiosk mode."""
@@ -601,7 +852,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 "action": "null"
             }]
         }
-        return web.json_response(content)
+        return _json_response(content)
 
     async def _handle_kiosk_album(self, request: web.Request) -> web.Response:
         """Return fake album for kiosk mode - waiting for playback."""
@@ -640,7 +891,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             )
             content["extension"] = sendspin_url
         
-        return web.json_response(content)
+        return _json_response(content)
 
     # --- MSX Content Pages (native MSX JSON) ---
 
@@ -666,12 +917,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         ]
         content = MsxContent(
             headline="Music Assistant",
-            template=MsxTemplate(
-                type="separate",
-                layout="0,0,2,4",
-                icon="msx-white-soft:music-note",
-                action="content:{context:content}",
-            ),
+            template=_TPL_MENU,
             items=[
                 MsxItem(
                     label=label,
@@ -681,14 +927,16 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 for label, icon, url in items
             ],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(content)
 
     async def _handle_msx_albums(self, request: web.Request) -> web.Response:
         """Return albums as an MSX content page."""
         _, device_param, _ = await self._ensure_player_for_request(request)
         prefix = f"http://{request.host}"
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        cache_key = ("msx_albums", request.host, device_param, limit, offset)
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         albums = await self.provider.mass.music.albums.library_items(
             limit=limit, offset=offset
         )
@@ -698,21 +946,19 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         )
         content = MsxContent(
             headline="Albums",
-            template=MsxTemplate(
-                type="separate",
-                layout="0,0,3,4",
-                color="msx-glass",
-            ),
+            template=_TPL_ALBUM_GRID,
             items=items if items else [MsxItem(title="No albums found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return self._cache_msx_list(request, cache_key, content)
 
     async def _handle_msx_artists(self, request: web.Request) -> web.Response:
         """Return artists as an MSX content page."""
         _, device_param, _ = await self._ensure_player_for_request(request)
         prefix = f"http://{request.host}"
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        cache_key = ("msx_artists", request.host, device_param, limit, offset)
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         artists = await self.provider.mass.music.artists.library_items(
             limit=limit, offset=offset
         )
@@ -722,21 +968,19 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         ]
         content = MsxContent(
             headline="Artists",
-            template=MsxTemplate(
-                type="separate",
-                layout="0,0,2,3",
-                color="msx-glass",
-            ),
+            template=_TPL_ARTIST_GRID,
             items=items if items else [MsxItem(title="No artists found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return self._cache_msx_list(request, cache_key, content)
 
     async def _handle_msx_playlists(self, request: web.Request) -> web.Response:
         """Return playlists as an MSX content page."""
         _, device_param, _ = await self._ensure_player_for_request(request)
         prefix = f"http://{request.host}"
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        cache_key = ("msx_playlists", request.host, device_param, limit, offset)
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         playlists = await self.provider.mass.music.playlists.library_items(
             limit=limit, offset=offset
         )
@@ -747,25 +991,32 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         ]
         content = MsxContent(
             headline="Playlists",
-            template=MsxTemplate(
-                type="separate",
-                layout="0,0,3,4",
-                color="msx-glass",
-            ),
+            template=_TPL_ALBUM_GRID,
             items=items if items else [MsxItem(title="No playlists found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return self._cache_msx_list(request, cache_key, content)
 
     async def _handle_msx_tracks(self, request: web.Request) -> web.Response:
         """Return tracks as an MSX content page."""
         player_id, device_param, _ = await self._ensure_player_for_request(request)
         prefix = f"http://{request.host}"
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        sendspin_enabled, sendspin_server = self._get_sendspin_settings(request)
+        cache_key = (
+            "msx_tracks",
+            request.host,
+            player_id,
+            device_param,
+            sendspin_enabled,
+            sendspin_server,
+            limit,
+            offset,
+        )
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         tracks = await self.provider.mass.music.tracks.library_items(
             limit=limit, offset=offset
         )
-        sendspin_enabled, sendspin_server = self._get_sendspin_settings(request)
 
         playlist_base = (
             f"{prefix}/msx/playlist/tracks.json?limit={limit}&offset={offset}"
@@ -786,15 +1037,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         ]
         content = MsxContent(
             headline="Tracks",
-            template=MsxTemplate(
-                type="default",
-                layout="0,0,6,1",
-                image_width=0.83,
-                color="msx-glass",
-            ),
+            template=_TPL_TRACK_LIST,
             items=items if items else [MsxItem(title="No tracks found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return self._cache_msx_list(request, cache_key, content)
 
     async def _handle_msx_recently_played(self, request: web.Request) -> web.Response:
         """Return recently played tracks as an MSX content page."""
@@ -821,15 +1067,12 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         ]
         content = MsxContent(
             headline="Recently played",
-            template=MsxTemplate(
-                type="default",
-                layout="0,0,6,1",
-                image_width=0.83,
-                color="msx-glass",
-            ),
+            template=_TPL_TRACK_LIST,
             items=items if items else [MsxItem(title="No recently played tracks")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        # Polled by the TV and changes with every play, so revalidate, don't cache
+        body = _msx_body(content)
+        return _list_response(request, body, _body_etag(body))
 
     async def _handle_msx_search_page(self, request: web.Request) -> web.Response:
         """Return a content page whose page-level action launches the Input Plugin keyboard."""
@@ -847,10 +1090,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         content = MsxContent(
             headline="Search",
             action=action,
-            template=MsxTemplate(
-                type="separate",
-                layout="0,0,2,4",
-            ),
+            template=_TPL_SEARCH_PAGE,
             items=[
                 MsxItem(
                     title="Search Music",
@@ -860,7 +1100,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 )
             ],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(content)
 
     async def _handle_msx_search_input(self, request: web.Request) -> web.Response:
         """Return search results for the MSX Input Plugin (search keyboard)."""
@@ -871,16 +1111,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             content = MsxContent(
                 headline="{ico:search} Search",
                 hint="Type to search...",
-                template=MsxTemplate(
-                    type="separate",
-                    layout="0,0,2,4",
-                    image_filler="default",
-                ),
+                template=_TPL_SEARCH_RESULTS,
                 items=[MsxItem(title="Start typing to search")],
             )
-            return web.json_response(
-                content.model_dump(by_alias=True, exclude_none=True)
-            )
+            return _msx_response(content)
 
         limit = _int_param(request.query, "limit", 20)
         sendspin_enabled, sendspin_server = self._get_sendspin_settings(request)
@@ -891,14 +1125,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         content = MsxContent(
             headline=f'{{ico:search}} "{query}"',
             hint=f"Found {len(items)} items",
-            template=MsxTemplate(
-                type="separate",
-                layout="0,0,2,4",
-                image_filler="default",
-            ),
+            template=_TPL_SEARCH_RESULTS,
             items=items if items else [MsxItem(title="No results found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(content)
 
     async def _handle_msx_search(self, request: web.Request) -> web.Response:
         """Return search results as an MSX content page."""
@@ -906,11 +1136,11 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         prefix = f"http://{request.host}"
         query = request.query.get("q", "")
         if not query:
-            return web.json_response(
+            return _msx_response(
                 MsxContent(
                     headline="Search",
                     items=[MsxItem(title="Please enter a search query")],
-                ).model_dump(by_alias=True, exclude_none=True)
+                )
             )
 
         limit = _int_param(request.query, "limit", 20)
@@ -921,14 +1151,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
 
         content = MsxContent(
             headline=f"Search: {query}",
-            template=MsxTemplate(
-                type="separate",
-                layout="0,0,2,4",
-                image_filler="default",
-            ),
+            template=_TPL_SEARCH_RESULTS,
             items=items if items else [MsxItem(title="No results found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(content)
 
     async def _build_search_items(
         self,
@@ -942,21 +1168,22 @@ small {{ color: #666; display: block; margin-top: 4px; }}
     ) -> list[MsxItem]:
         """Build MSX items from search results (shared by search handlers)."""
         results = await self.provider.mass.music.search(query, limit=limit)
-        items: list[MsxItem] = []
-        for artist in results.artists:
-            item = map_artist_to_msx(artist, prefix, self.provider, device_param)
-            item.label = "Artist"
-            item.icon = "msx-white-soft:person"
-            items.append(item)
-        for album in results.albums:
-            item = await map_album_to_msx(album, prefix, self.provider, device_param)
-            item.label = f"Album — {getattr(album, 'artist_str', '')}"
-            item.icon = "msx-white-soft:album"
-            items.append(item)
+        items: list[MsxItem] = [
+            map_artist_to_msx(a, prefix, self.provider, device_param, "Artist")
+            for a in results.artists
+        ]
+        items.extend(
+            await asyncio.gather(
+                *(
+                    map_album_to_msx(a, prefix, self.provider, device_param, "Album")
+                    for a in results.albums
+                )
+            )
+        )
         playlist_base = f"{prefix}/msx/playlist/search.json?q={quote(query, safe='')}"
         playlist_base = append_device_param(playlist_base, device_param)
-        for idx, track in enumerate(results.tracks):
-            item = map_track_to_msx(
+        items.extend(
+            map_track_to_msx(
                 track,
                 prefix,
                 player_id,
@@ -965,10 +1192,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 playlist_url=f"{playlist_base}&start={idx}",
                 sendspin_enabled=sendspin_enabled,
                 sendspin_server=sendspin_server,
+                search_kind="Track",
             )
-            item.label = f"Track — {getattr(track, 'artist_str', '')}"
-            item.icon = "msx-white-soft:audiotrack"
-            items.append(item)
+            for idx, track in enumerate(results.tracks)
+        )
         return items
 
     # --- MSX Detail Pages ---
@@ -1006,15 +1233,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         ]
         content = MsxContent(
             headline="Album Tracks",
-            template=MsxTemplate(
-                type="default",
-                layout="0,0,6,1",
-                image_width=0.83,
-                color="msx-glass",
-            ),
+            template=_TPL_TRACK_LIST,
             items=items if items else [MsxItem(title="No tracks found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(content)
 
     async def _handle_msx_artist_albums(self, request: web.Request) -> web.Response:
         """Return albums for an artist as an MSX content page."""
@@ -1032,15 +1254,10 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         )
         content = MsxContent(
             headline="Artist Albums",
-            template=MsxTemplate(
-                type="default",
-                layout="0,0,6,2",
-                image_width=1.5,
-                color="msx-glass",
-            ),
+            template=_TPL_ALBUM_LIST,
             items=items if items else [MsxItem(title="No albums found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(content)
 
     async def _handle_msx_playlist_tracks(self, request: web.Request) -> web.Response:
         """Return tracks for a playlist as an MSX content page."""
@@ -1048,42 +1265,36 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         prefix = f"http://{request.host}"
         item_id = request.match_info["item_id"]
         sendspin_enabled, sendspin_server = self._get_sendspin_settings(request)
+        playlist_base = f"{prefix}/msx/playlist/playlist/{item_id}.json"
+        playlist_base = append_device_param(playlist_base, device_param)
+        start_sep = "&" if "?" in playlist_base else "?"
+        # Map tracks as they arrive so the Track objects are not kept alongside
+        items: list[MsxItem] = []
         try:
-            tracks = [
-                t
-                async for t in self.provider.mass.music.playlists.tracks(
-                    item_id, "library"
+            async for t in self.provider.mass.music.playlists.tracks(
+                item_id, "library"
+            ):
+                items.append(
+                    map_track_to_msx(
+                        t,
+                        prefix,
+                        player_id,
+                        self.provider,
+                        device_param,
+                        playlist_url=f"{playlist_base}{start_sep}start={len(items)}",
+                        sendspin_enabled=sendspin_enabled,
+                        sendspin_server=sendspin_server,
+                    )
                 )
-            ]
         except Exception:
             logger.exception("Failed to fetch tracks for playlist %s", item_id)
-            tracks = []
-        playlist_base = f"{prefix}/msx/playlist/playlist/{item_id}.json"
-        playlist_base = append_device_param(playlist_base, device_param)
-        items = [
-            map_track_to_msx(
-                t,
-                prefix,
-                player_id,
-                self.provider,
-                device_param,
-                playlist_url=f"{playlist_base}{'&' if '?' in playlist_base else '?'}start={idx}",
-                sendspin_enabled=sendspin_enabled,
-                sendspin_server=sendspin_server,
-            )
-            for idx, t in enumerate(tracks)
-        ]
+            items = []
         content = MsxContent(
             headline="Playlist Tracks",
-            template=MsxTemplate(
-                type="default",
-                layout="0,0,6,1",
-                image_width=0.83,
-                color="msx-glass",
-            ),
+            template=_TPL_TRACK_LIST,
             items=items if items else [MsxItem(title="No tracks found")],
         )
-        return web.json_response(content.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(content)
 
     # --- MSX Playlist Endpoints ---
 
@@ -1106,7 +1317,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             tracks, start, prefix, player_id, self.provider, device_param,
             sendspin_enabled, sendspin_server
         )
-        return web.json_response(playlist.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(playlist)
 
     async def _handle_msx_playlist_playlist(self, request: web.Request) -> web.Response:
         """Return playlist tracks as an MSX playlist JSON."""
@@ -1129,14 +1340,13 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             tracks, start, prefix, player_id, self.provider, device_param,
             sendspin_enabled, sendspin_server
         )
-        return web.json_response(playlist.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(playlist)
 
     async def _handle_msx_tracks_playlist(self, request: web.Request) -> web.Response:
         """Return library tracks as an MSX playlist JSON."""
         player_id, device_param, _ = await self._ensure_player_for_request(request)
         prefix = f"http://{request.host}"
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
         start = _int_param(request.query, "start", 0)
         sendspin_enabled, sendspin_server = self._get_sendspin_settings(request)
         tracks = await self.provider.mass.music.tracks.library_items(
@@ -1146,7 +1356,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             list(tracks), start, prefix, player_id, self.provider, device_param,
             sendspin_enabled, sendspin_server
         )
-        return web.json_response(playlist.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(playlist)
 
     async def _handle_msx_recently_played_playlist(
         self, request: web.Request
@@ -1163,7 +1373,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             list(tracks), start, prefix, player_id, self.provider, device_param,
             sendspin_enabled, sendspin_server
         )
-        return web.json_response(playlist.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(playlist)
 
     async def _handle_msx_search_playlist(self, request: web.Request) -> web.Response:
         """Return search track results as an MSX playlist JSON."""
@@ -1172,9 +1382,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         query = request.query.get("q", "")
         start = _int_param(request.query, "start", 0)
         if not query:
-            return web.json_response(
-                MsxContent(items=[]).model_dump(by_alias=True, exclude_none=True)
-            )
+            return _msx_response(MsxContent(items=[]))
         limit = _int_param(request.query, "limit", 20)
         sendspin_enabled, sendspin_server = self._get_sendspin_settings(request)
         results = await self.provider.mass.music.search(query, limit=limit)
@@ -1182,7 +1390,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             list(results.tracks), start, prefix, player_id, self.provider, device_param,
             sendspin_enabled, sendspin_server
         )
-        return web.json_response(playlist.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(playlist)
 
     # --- MSX Queue Playlist ---
 
@@ -1221,7 +1429,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             tracks, start, prefix, player_id, self.provider, device_param,
             sendspin_enabled, sendspin_server
         )
-        return web.json_response(playlist.model_dump(by_alias=True, exclude_none=True))
+        return _msx_response(playlist)
 
     # --- MSX Audio Playback ---
 
@@ -1272,18 +1480,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             return web.Response(status=504, text="Playback setup timeout")
 
         # Resolve duration from media or queue item for Content-Length header
-        duration = media.duration or 0
-        if not duration and media.source_id and media.queue_item_id:
-            queue_item = self.provider.mass.player_queues.get_item(
-                media.source_id, media.queue_item_id
-            )
-            if queue_item:
-                if queue_item.media_item:
-                    duration = (
-                        getattr(queue_item.media_item, "duration", None) or duration
-                    )
-                if not duration and queue_item.duration:
-                    duration = queue_item.duration
+        duration = media.duration or self._queue_item_duration(media)
 
         return await self._serve_audio_stream(
             request,
@@ -1294,24 +1491,55 @@ small {{ color: #666; display: block; margin-top: 4px; }}
 
     # --- Audio Streaming Infrastructure ---
 
+    def _queue_item_duration(self, media: Any, fallback: int = 0) -> int:
+        """Return the duration of the queue item behind ``media`` (0 if unknown).
+
+        The media item's duration wins, then ``fallback``, then the queue
+        item's own duration. Lookups are kept for DURATION_CACHE_TTL seconds so
+        a client reopening the same stream URL does not resolve them again.
+        """
+        if not (media.source_id and media.queue_item_id):
+            return fallback
+        key = (media.source_id, media.queue_item_id)
+        now = time.monotonic()
+        cached = self._duration_cache.get(key)
+        if cached is not None and now - cached[0] < DURATION_CACHE_TTL:
+            _, item_duration, queue_duration = cached
+            return item_duration or fallback or queue_duration
+
+        item_duration = queue_duration = 0
+        queue_item = self.provider.mass.player_queues.get_item(*key)
+        if queue_item:
+            if queue_item.media_item:
+                item_duration = getattr(queue_item.media_item, "duration", None) or 0
+            queue_duration = queue_item.duration or 0
+        # Drop stale entries so the cache only ever holds recent queue items
+        self._duration_cache = {
+            k: v
+            for k, v in self._duration_cache.items()
+            if now - v[0] < DURATION_CACHE_TTL
+        }
+        self._duration_cache[key] = (now, item_duration, queue_duration)
+        return item_duration or fallback or queue_duration
+
     @staticmethod
     def _build_audio_params(
         output_format_str: str, duration: int
-    ) -> tuple[AudioFormat, AudioFormat, dict[str, str]]:
-        """Build PCM input format, encoded output format, and HTTP headers."""
+    ) -> tuple[AudioFormat, AudioFormat, CIMultiDictProxy[str], int | None]:
+        """Build PCM input format, encoded output format, HTTP headers and body size.
+
+        The estimated body size is returned separately (not as a header) so it
+        can be set via ``StreamResponse.content_length``, which makes aiohttp
+        use the identity writer instead of chunked transfer encoding.
+        """
         pcm_format = AudioFormat(
             content_type=ContentType.PCM_S16LE,
             sample_rate=44100,
             bit_depth=16,
             channels=2,
         )
-        content_type_map: dict[str, tuple[ContentType, str]] = {
-            "mp3": (ContentType.MP3, "audio/mpeg"),
-            "aac": (ContentType.AAC, "audio/aac"),
-            "flac": (ContentType.FLAC, "audio/flac"),
-        }
-        codec, mime_type = content_type_map.get(
-            output_format_str, (ContentType.MP3, "audio/mpeg")
+        codec, mime_type, bytes_per_sec = _OUTPUT_FORMATS.get(
+            output_format_str, _DEFAULT_OUTPUT_FORMAT
         )
         out_format = AudioFormat(
             content_type=codec,
@@ -1319,17 +1547,51 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             bit_depth=16,
             channels=2,
         )
-        bitrate_map = {"mp3": 40_000, "aac": 32_000}
-        bytes_per_sec = bitrate_map.get(output_format_str, 0)
-        headers: dict[str, str] = {
-            "Content-Type": mime_type,
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Accept-Ranges": "none",
-        }
-        if duration and bytes_per_sec:
-            headers["Content-Length"] = str(int(duration * bytes_per_sec))
-        return pcm_format, out_format, headers
+        content_length = (
+            int(duration * bytes_per_sec) if duration and bytes_per_sec else None
+        )
+        return pcm_format, out_format, _STREAM_HEADERS[mime_type], content_length
+
+    @staticmethod
+    def _new_stream_response(
+        headers: Mapping[str, str], content_length: int | None
+    ) -> web.StreamResponse:
+        """Create an audio StreamResponse, sized up-front when the length is known.
+
+        With ``content_length`` set before ``prepare()`` aiohttp sends the body
+        as a raw stream (no chunk framing) and truncates any over-production.
+        """
+        response = web.StreamResponse(status=200, headers=headers)
+        if content_length:
+            response.content_length = content_length
+        return response
+
+    async def _finish_sized_body(
+        self, response: web.StreamResponse, player_id: str, total_bytes: int
+    ) -> None:
+        """Complete a sized body after ffmpeg under-produced vs Content-Length.
+
+        Small gaps are padded with zero bytes (decoders skip them as junk
+        between frames) so the TV sees a complete response. Large gaps mean
+        the stream ended early; the connection is closed instead of leaving
+        the client waiting for bytes that will never arrive.
+        """
+        content_length = response.content_length
+        if not content_length or total_bytes >= content_length:
+            return
+        missing = content_length - total_bytes
+        if missing > MAX_PAD_BYTES:
+            logger.debug(
+                "Stream %s ended %d bytes short of Content-Length, closing",
+                player_id,
+                missing,
+            )
+            response.force_close()
+            return
+        while missing > 0:
+            pad = min(missing, len(_PAD_CHUNK))
+            await response.write(_PAD_CHUNK[:pad])
+            missing -= pad
 
     async def _serve_audio_stream(
         self,
@@ -1370,7 +1632,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 player_id,
             )
 
-        pcm_format, out_format, headers = self._build_audio_params(
+        pcm_format, out_format, headers, content_length = self._build_audio_params(
             player.output_format,
             duration,
         )
@@ -1384,7 +1646,14 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 group_id,
             )
             return await self._serve_shared_stream(
-                request, player, media, group_id, pcm_format, out_format, headers
+                request,
+                player,
+                media,
+                group_id,
+                pcm_format,
+                out_format,
+                headers,
+                content_length,
             )
 
         # --- Mode 3: Independent (default) ---
@@ -1401,14 +1670,13 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             force_flow_mode=False,
         )
 
-        response = web.StreamResponse(status=200, headers=headers)
+        response = self._new_stream_response(headers, content_length)
         stream_task: asyncio.Task[None] = asyncio.create_task(
             self._stream_with_prebuffer(
-                request, response, player, headers, audio_source, pcm_format, out_format
+                request, response, player, audio_source, pcm_format, out_format
             )
         )
-        transport = getattr(request, "transport", None)
-        await self._run_stream_task(player_id, stream_task, transport)
+        await self._run_stream_task(player_id, stream_task, request.transport)
 
         return response
 
@@ -1420,7 +1688,8 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         group_id: str,
         pcm_format: AudioFormat,
         out_format: AudioFormat,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
+        content_length: int | None = None,
     ) -> web.StreamResponse:
         """Serve audio from a shared group stream.
 
@@ -1471,12 +1740,9 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 player_id,
                 group_id,
             )
-            for _ in range(30):  # Wait up to 3 seconds
-                await asyncio.sleep(0.1)
-                existing_stream = self.provider._shared_streams.get(group_id)
-                if existing_stream and not existing_stream.finished:
-                    shared_stream = existing_stream
-                    break
+            waited = await self.provider.wait_for_shared_stream(group_id, timeout=3.0)
+            if waited is not None:
+                shared_stream = waited
             else:
                 # Timeout - fallback to independent stream
                 logger.warning(
@@ -1485,11 +1751,17 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                     player_id,
                 )
                 return await self._serve_independent_stream(
-                    request, player, media, pcm_format, out_format, headers
+                    request,
+                    player,
+                    media,
+                    pcm_format,
+                    out_format,
+                    headers,
+                    content_length,
                 )
 
         # Subscribe to shared stream
-        response = web.StreamResponse(status=200, headers=headers)
+        response = self._new_stream_response(headers, content_length)
         await response.prepare(request)
 
         total_bytes = 0
@@ -1497,6 +1769,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             async for chunk in shared_stream.subscribe(player_id):
                 await response.write(chunk)
                 total_bytes += len(chunk)
+            await self._finish_sized_body(response, player_id, total_bytes)
         except (ConnectionResetError, BrokenPipeError, ConnectionAbortedError):
             logger.debug(
                 "[SharedStream] Client %s disconnected after %d bytes",
@@ -1521,7 +1794,8 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         media: Any,
         pcm_format: AudioFormat,
         out_format: AudioFormat,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
+        content_length: int | None = None,
     ) -> web.StreamResponse:
         """Serve audio via independent ffmpeg stream (fallback)."""
         player_id = player.player_id
@@ -1536,14 +1810,13 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             force_flow_mode=False,
         )
 
-        response = web.StreamResponse(status=200, headers=headers)
+        response = self._new_stream_response(headers, content_length)
         stream_task: asyncio.Task[None] = asyncio.create_task(
             self._stream_with_prebuffer(
-                request, response, player, headers, audio_source, pcm_format, out_format
+                request, response, player, audio_source, pcm_format, out_format
             )
         )
-        transport = getattr(request, "transport", None)
-        await self._run_stream_task(player_id, stream_task, transport)
+        await self._run_stream_task(player_id, stream_task, request.transport)
 
         return response
 
@@ -1552,7 +1825,6 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         request: web.Request,
         response: web.StreamResponse,
         player: MSXPlayer,
-        headers: dict[str, str],
         audio_source: Any,
         pcm_format: AudioFormat,
         out_format: AudioFormat,
@@ -1561,6 +1833,9 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         player_id = player.player_id
         chunk_queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=32)
 
+        # One encoder per stream on purpose: a process kept warm across tracks
+        # would carry encoder delay and partial frames into the next track's
+        # sized (Content-Length) body.
         async def producer() -> None:
             try:
                 async for chunk in get_ffmpeg_stream(
@@ -1589,26 +1864,29 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 pre_buffer_size += len(chunk)
 
             # Re-check: stop may have been called while buffering
-            if not player.current_media and not pre_buffer:
+            if not player.has_media and not pre_buffer:
                 return
 
             # NOW send HTTP headers + pre-buffer burst
             await response.prepare(request)
-            for buf_chunk in pre_buffer:
-                await response.write(buf_chunk)
-                total_bytes += len(buf_chunk)
-
-            # If pre-buffer ended with sentinel, we're done
-            if chunk is None:
-                return
-
-            # Phase 2: Stream remaining chunks normally
-            while True:
+            if pre_buffer:
+                burst = b"".join(pre_buffer)
+                await response.write(burst)
+                total_bytes += len(burst)
+
+            # Phase 2: Stream remaining chunks (unless pre-buffer already ended
+            # with the sentinel). Chunks that queued up while the previous write
+            # was draining go out in one write, as does the tail before EOF.
+            eof = chunk is None
+            while not eof:
                 chunk = await chunk_queue.get()
                 if chunk is None:
                     break
-                await response.write(chunk)
-                total_bytes += len(chunk)
+                data, eof = _drain_ready(chunk_queue, chunk)
+                await response.write(data)
+                total_bytes += len(data)
+
+            await self._finish_sized_body(response, player_id, total_bytes)
         except (ConnectionResetError, BrokenPipeError, ConnectionAbortedError):
             logger.debug("Client disconnected from stream %s", player_id)
         except asyncio.CancelledError:
@@ -1619,14 +1897,14 @@ small {{ color: #666; display: block; margin-top: 4px; }}
                 producer_task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await producer_task
-            content_length = headers.get("Content-Length")
+            content_length = response.content_length
             if content_length:
                 logger.debug(
-                    "Stream %s: wrote %d bytes, Content-Length=%s, diff=%d",
+                    "Stream %s: wrote %d bytes, Content-Length=%d, diff=%d",
                     player_id,
                     total_bytes,
                     content_length,
-                    total_bytes - int(content_length),
+                    total_bytes - content_length,
                 )
             else:
                 logger.debug(
@@ -1654,7 +1932,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
 
     async def _handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
-        return web.json_response(
+        return _json_response(
             {
                 "status": "ok",
                 "provider": "msx_bridge",
@@ -1673,24 +1951,25 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         await ws.prepare(request)
 
         player_id, _, _ = await self._ensure_player_for_request(request)
-        if player_id not in self._ws_clients:
-            self._ws_clients[player_id] = set()
-        self._ws_clients[player_id].add(ws)
+        conns = self._connections.setdefault(player_id, _PlayerConnections())
+        conns.ws.add(ws)
         logger.info(
             "WebSocket connected: player_id=%s, clients_for_player=%d, all_players=%s",
             player_id,
-            len(self._ws_clients[player_id]),
-            list(self._ws_clients.keys()),
+            len(conns.ws),
+            self._ws_player_ids(),
         )
 
+        # The iterator ends on CLOSE/CLOSING/CLOSED; pings are answered inside
+        # aiohttp (autoping), so only TEXT commands from the TV reach this loop.
         try:
             async for msg in ws:
-                if msg.type == msg.type.TEXT:
+                if msg.type is WSMsgType.TEXT:
                     self._handle_ws_message(player_id, msg.data)
         finally:
-            self._ws_clients.get(player_id, set()).discard(ws)
-            if not self._ws_clients.get(player_id):
-                self._ws_clients.pop(player_id, None)
+            if conns := self._connections.get(player_id):
+                conns.ws.discard(ws)
+                self._prune_connections(player_id)
             logger.debug("WebSocket client disconnected for player %s", player_id)
 
         return ws
@@ -1707,12 +1986,12 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         prev_action: str | None = None,
     ) -> None:
         """Notify subscribed WebSocket clients to start playback with metadata."""
-        clients = self._ws_clients.get(player_id, set())
+        clients = self._get_ws_clients(player_id)
         if not clients:
             logger.warning(
                 "broadcast_play: no WebSocket clients for player_id=%s (connected: %s)",
                 player_id,
-                list(self._ws_clients.keys()),
+                self._ws_player_ids(),
             )
             return
         logger.info(
@@ -1737,19 +2016,17 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             payload["next_action"] = next_action
         if prev_action:
             payload["prev_action"] = prev_action
-        msg = json.dumps(payload)
-        for ws in list(clients):
-            if not ws.closed:
-                self.provider.mass.create_task(self._ws_send(ws, msg))
+        msg = orjson.dumps(payload).decode()
+        self._broadcast(clients, msg)
 
     def broadcast_playlist(self, player_id: str, playlist_url: str) -> None:
         """Notify subscribed WebSocket clients to load an MSX native playlist."""
-        clients = self._ws_clients.get(player_id, set())
+        clients = self._get_ws_clients(player_id)
         if not clients:
             logger.warning(
                 "broadcast_playlist: no WebSocket clients for player_id=%s (connected: %s)",
                 player_id,
-                list(self._ws_clients.keys()),
+                self._ws_player_ids(),
             )
             return
         logger.info(
@@ -1759,14 +2036,12 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             len(clients),
         )
         payload: dict[str, Any] = {"type": "playlist", "url": playlist_url}
-        msg = json.dumps(payload)
-        for ws in list(clients):
-            if not ws.closed:
-                self.provider.mass.create_task(self._ws_send(ws, msg))
+        msg = orjson.dumps(payload).decode()
+        self._broadcast(clients, msg)
 
     def broadcast_goto_index(self, player_id: str, index: int) -> None:
         """Notify subscribed WebSocket clients to jump to a playlist index."""
-        clients = self._ws_clients.get(player_id, set())
+        clients = self._get_ws_clients(player_id)
         if not clients:
             return
         logger.info(
@@ -1776,22 +2051,22 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             len(clients),
         )
         payload: dict[str, Any] = {"type": "goto_index", "index": index}
-        msg = json.dumps(payload)
-        for ws in list(clients):
-            if not ws.closed:
-                self.provider.mass.create_task(self._ws_send(ws, msg))
+        msg = orjson.dumps(payload).decode()
+        self._broadcast(clients, msg)
 
     def cancel_streams_for_player(self, player_id: str) -> None:
         """Cancel stream tasks and abort connections for the given player."""
-        tasks = self._active_stream_tasks.pop(player_id, set())
-        transports = self._active_stream_transports.pop(player_id, set())
+        conns = self._connections.get(player_id)
+        if not conns:
+            return
+        tasks, conns.tasks = conns.tasks, set()
+        transports, conns.transports = conns.transports, set()
+        self._prune_connections(player_id)
         for task in tasks:
             if not task.done():
                 task.cancel()
         for transport in transports:
-            with contextlib.suppress(Exception):
-                if transport and hasattr(transport, "abort"):
-                    transport.abort()
+            _safe_abort(transport)
         if tasks or transports:
             logger.debug(
                 "Cancelled %d task(s), aborted %d transport(s) for player %s",
@@ -1804,31 +2079,45 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         self, player_id: str, task: asyncio.Task[None], transport: Any
     ) -> None:
         """Register active stream task and transport for cancel on stop."""
-        if player_id not in self._active_stream_tasks:
-            self._active_stream_tasks[player_id] = set()
-            self._active_stream_transports[player_id] = set()
+        conns = self._connections.setdefault(player_id, _PlayerConnections())
         if task:
-            self._active_stream_tasks[player_id].add(task)
+            conns.tasks.add(task)
         if transport:
-            self._active_stream_transports[player_id].add(transport)
+            conns.transports.add(transport)
 
     def _unregister_stream(
         self, player_id: str, task: asyncio.Task[None], transport: Any
     ) -> None:
         """Unregister stream when done (from finally block)."""
-        if player_id not in self._active_stream_tasks:
+        conns = self._connections.get(player_id)
+        if not conns:
             return
         if task:
-            self._active_stream_tasks[player_id].discard(task)
+            conns.tasks.discard(task)
         if transport:
-            self._active_stream_transports[player_id].discard(transport)
-        if not self._active_stream_tasks[player_id]:
-            del self._active_stream_tasks[player_id]
-            del self._active_stream_transports[player_id]
+            conns.transports.discard(transport)
+        if not conns.tasks:
+            conns.transports.clear()
+        self._prune_connections(player_id)
+
+    def _get_ws_clients(self, player_id: str) -> list[web.WebSocketResponse]:
+        """Return a snapshot of the WebSocket clients subscribed to a player."""
+        conns = self._connections.get(player_id)
+        return list(conns.ws) if conns else []
+
+    def _ws_player_ids(self) -> list[str]:
+        """Return the player_ids that have at least one WebSocket client."""
+        return [pid for pid, conns in self._connections.items() if conns.ws]
+
+    def _prune_connections(self, player_id: str) -> None:
+        """Drop a player's connection record once nothing is left in it."""
+        conns = self._connections.get(player_id)
+        if conns and not (conns.ws or conns.tasks or conns.transports):
+            del self._connections[player_id]
 
     def broadcast_pause(self, player_id: str) -> None:
         """Notify subscribed WebSocket clients to pause playback."""
-        clients = self._ws_clients.get(player_id, set())
+        clients = self._get_ws_clients(player_id)
         if not clients:
             return
         logger.info(
@@ -1836,14 +2125,11 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             player_id,
             len(clients),
         )
-        msg = json.dumps({"type": "pause"})
-        for ws in list(clients):
-            if not ws.closed:
-                self.provider.mass.create_task(self._ws_send(ws, msg))
+        self._broadcast(clients, _PAUSE_MSG)
 
     def broadcast_resume(self, player_id: str) -> None:
         """Notify subscribed WebSocket clients to resume playback."""
-        clients = self._ws_clients.get(player_id, set())
+        clients = self._get_ws_clients(player_id)
         if not clients:
             return
         logger.info(
@@ -1851,19 +2137,16 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             player_id,
             len(clients),
         )
-        msg = json.dumps({"type": "resume"})
-        for ws in list(clients):
-            if not ws.closed:
-                self.provider.mass.create_task(self._ws_send(ws, msg))
+        self._broadcast(clients, _RESUME_MSG)
 
     def broadcast_stop(self, player_id: str) -> None:
         """Notify subscribed WebSocket clients to stop playback."""
-        clients = self._ws_clients.get(player_id, set())
+        clients = self._get_ws_clients(player_id)
         if not clients:
             logger.warning(
                 "broadcast_stop: no WebSocket clients for player_id=%s (connected: %s)",
                 player_id,
-                list(self._ws_clients.keys()),
+                self._ws_player_ids(),
             )
             return
         logger.info(
@@ -1871,24 +2154,33 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             player_id,
             len(clients),
         )
-        show_notification = self.provider.config.get_value(
-            CONF_SHOW_STOP_NOTIFICATION, DEFAULT_SHOW_STOP_NOTIFICATION
-        )
-        payload: dict[str, Any] = {
-            "type": "stop",
-            "showNotification": bool(show_notification),
-        }
-        msg = json.dumps(payload)
-        for ws in list(clients):
-            if not ws.closed:
-                self.provider.mass.create_task(self._ws_send(ws, msg))
+        if self._stop_msg is None:
+            show_notification = self.provider.config.get_value(
+                CONF_SHOW_STOP_NOTIFICATION, DEFAULT_SHOW_STOP_NOTIFICATION
+            )
+            payload: dict[str, Any] = {
+                "type": "stop",
+                "showNotification": bool(show_notification),
+            }
+            self._stop_msg = orjson.dumps(payload).decode()
+        self._broadcast(clients, self._stop_msg)
 
-    async def _ws_send(self, ws: web.WebSocketResponse, text: str) -> None:
-        """Send text to WebSocket, ignore errors."""
-        try:
-            await ws.send_str(text)
-        except Exception as exc:
-            logger.debug("WebSocket send failed: %s", exc)
+    def _broadcast(self, clients: list[web.WebSocketResponse], text: str) -> None:
+        """Send one pre-encoded message to all open clients from a single task."""
+        targets = [ws for ws in clients if not ws.closed]
+        if targets:
+            self.provider.mass.create_task(self._ws_send_all(targets, text))
+
+    async def _ws_send_all(
+        self, targets: list[web.WebSocketResponse], text: str
+    ) -> None:
+        """Send text to several WebSockets concurrently, ignore errors."""
+        results = await asyncio.gather(
+            *(ws.send_str(text) for ws in targets), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("WebSocket send failed: %s", result)
 
     async def _cmd_pause_no_echo(self, player_id: str) -> None:
         """Pause player without echoing back to MSX."""
@@ -1911,8 +2203,8 @@ small {{ color: #666; display: block; margin-top: 4px; }}
     def _handle_ws_message(self, player_id: str, data: str) -> None:
         """Process an inbound WebSocket message from MSX."""
         try:
-            msg = json.loads(data)
-        except (json.JSONDecodeError, TypeError):
+            msg = orjson.loads(data)
+        except (orjson.JSONDecodeError, TypeError):
             logger.debug("Invalid WS message from %s: %s", player_id, data)
             return
 
@@ -1958,18 +2250,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         if not media:
             return web.Response(status=404, text="No active stream")
 
-        duration = media.duration or 0
-        if media.source_id and media.queue_item_id:
-            queue_item = self.provider.mass.player_queues.get_item(
-                media.source_id, media.queue_item_id
-            )
-            if queue_item:
-                if queue_item.media_item:
-                    duration = (
-                        getattr(queue_item.media_item, "duration", None) or duration
-                    )
-                if not duration and queue_item.duration:
-                    duration = queue_item.duration
+        duration = self._queue_item_duration(media, media.duration or 0)
 
         return await self._serve_audio_stream(
             request,
@@ -1982,32 +2263,29 @@ small {{ color: #666; display: block; margin-top: 4px; }}
 
     async def _handle_albums(self, request: web.Request) -> web.Response:
         """List albums."""
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        cache_key = ("albums", limit, offset)
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         albums = await self.provider.mass.music.albums.library_items(
             limit=limit, offset=offset
         )
-        return web.json_response(
+        return self._cache_list_response(
+            request,
+            cache_key,
             {
                 "items": [
-                    {
-                        "item_id": str(album.item_id),
-                        "name": album.name,
-                        "artist": getattr(album, "artist_str", ""),
-                        "image": get_image_url(album, self.provider),
-                        "uri": album.uri,
-                    }
-                    for album in albums
+                    _ApiAlbum.from_media(album, self.provider) for album in albums
                 ],
-                "total": albums.total if hasattr(albums, "total") else len(albums),
-            }
+                "total": _result_total(albums),
+            },
         )
 
     async def _handle_album_tracks(self, request: web.Request) -> web.Response:
         """List tracks for an album."""
         item_id = request.match_info["item_id"]
         tracks = await self.provider.mass.music.albums.tracks(item_id, "library")
-        return web.json_response(
+        return _json_response(
             {
                 "items": [self._format_track(track) for track in tracks],
             }
@@ -2015,135 +2293,103 @@ small {{ color: #666; display: block; margin-top: 4px; }}
 
     async def _handle_artists(self, request: web.Request) -> web.Response:
         """List artists."""
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        cache_key = ("artists", limit, offset)
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         artists = await self.provider.mass.music.artists.library_items(
             limit=limit, offset=offset
         )
-        return web.json_response(
+        return self._cache_list_response(
+            request,
+            cache_key,
             {
                 "items": [
-                    {
-                        "item_id": str(artist.item_id),
-                        "name": artist.name,
-                        "image": get_image_url(artist, self.provider),
-                        "uri": artist.uri,
-                    }
-                    for artist in artists
+                    _ApiItem.from_media(artist, self.provider) for artist in artists
                 ],
-                "total": artists.total if hasattr(artists, "total") else len(artists),
-            }
+                "total": _result_total(artists),
+            },
         )
 
     async def _handle_artist_albums(self, request: web.Request) -> web.Response:
         """List albums for an artist."""
         item_id = request.match_info["item_id"]
         albums = await self.provider.mass.music.artists.albums(item_id, "library")
-        return web.json_response(
+        return _json_response(
             {
                 "items": [
-                    {
-                        "item_id": str(album.item_id),
-                        "name": album.name,
-                        "artist": getattr(album, "artist_str", ""),
-                        "image": get_image_url(album, self.provider),
-                        "uri": album.uri,
-                    }
-                    for album in albums
+                    _ApiAlbum.from_media(album, self.provider) for album in albums
                 ],
             }
         )
 
     async def _handle_playlists(self, request: web.Request) -> web.Response:
         """List playlists."""
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        cache_key = ("playlists", limit, offset)
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         playlists = await self.provider.mass.music.playlists.library_items(
             limit=limit, offset=offset
         )
-        return web.json_response(
+        return self._cache_list_response(
+            request,
+            cache_key,
             {
                 "items": [
-                    {
-                        "item_id": str(playlist.item_id),
-                        "name": playlist.name,
-                        "image": get_image_url(playlist, self.provider),
-                        "uri": playlist.uri,
-                    }
+                    _ApiItem.from_media(playlist, self.provider)
                     for playlist in playlists
                 ],
-                "total": playlists.total
-                if hasattr(playlists, "total")
-                else len(playlists),
-            }
+                "total": _result_total(playlists),
+            },
         )
 
     async def _handle_playlist_tracks(self, request: web.Request) -> web.Response:
         """List tracks for a playlist."""
         item_id = request.match_info["item_id"]
-        tracks = [
-            t
+        # Format while iterating so the Track objects are not kept alongside
+        items = [
+            self._format_track(t)
             async for t in self.provider.mass.music.playlists.tracks(item_id, "library")
         ]
-        return web.json_response(
-            {
-                "items": [self._format_track(track) for track in tracks],
-            }
-        )
+        return _json_response({"items": items})
 
     async def _handle_tracks(self, request: web.Request) -> web.Response:
         """List tracks."""
-        limit = _int_param(request.query, "limit", 50)
-        offset = _int_param(request.query, "offset", 0)
+        limit, offset = _page_params(request.query)
+        cache_key = ("tracks", limit, offset)
+        if cached := self._get_cached_list(request, cache_key):
+            return cached
         tracks = await self.provider.mass.music.tracks.library_items(
             limit=limit, offset=offset
         )
-        return web.json_response(
+        return self._cache_list_response(
+            request,
+            cache_key,
             {
                 "items": [self._format_track(track) for track in tracks],
-                "total": tracks.total if hasattr(tracks, "total") else len(tracks),
-            }
+                "total": _result_total(tracks),
+            },
         )
 
     async def _handle_search(self, request: web.Request) -> web.Response:
         """Search the music library."""
         query = request.query.get("q", "")
         if not query:
-            return web.json_response(
-                {"error": "Missing query parameter 'q'"}, status=400
-            )
+            return _json_response({"error": "Missing query parameter 'q'"}, status=400)
         limit = _int_param(request.query, "limit", 20)
         results = await self.provider.mass.music.search(query, limit=limit)
-        return web.json_response(
+        return _json_response(
             {
                 "artists": [
-                    {
-                        "item_id": str(a.item_id),
-                        "name": a.name,
-                        "image": get_image_url(a, self.provider),
-                        "uri": a.uri,
-                    }
-                    for a in results.artists
+                    _ApiItem.from_media(a, self.provider) for a in results.artists
                 ],
                 "albums": [
-                    {
-                        "item_id": str(a.item_id),
-                        "name": a.name,
-                        "artist": getattr(a, "artist_str", ""),
-                        "image": get_image_url(a, self.provider),
-                        "uri": a.uri,
-                    }
-                    for a in results.albums
+                    _ApiAlbum.from_media(a, self.provider) for a in results.albums
                 ],
                 "tracks": [self._format_track(t) for t in results.tracks],
                 "playlists": [
-                    {
-                        "item_id": str(p.item_id),
-                        "name": p.name,
-                        "image": get_image_url(p, self.provider),
-                        "uri": p.uri,
-                    }
-                    for p in results.playlists
+                    _ApiItem.from_media(p, self.provider) for p in results.playlists
                 ],
             }
         )
@@ -2154,46 +2400,43 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         tracks = await self.provider.mass.music.tracks.library_items(
             limit=limit, order_by="last_played"
         )
-        return web.json_response(
-            {
-                "items": [self._format_track(track) for track in tracks],
-            }
-        )
+        body = orjson.dumps({"items": [self._format_track(t) for t in tracks]})
+        return _list_response(request, body, _body_etag(body))
 
     # --- Playback Control ---
 
     async def _handle_play(self, request: web.Request) -> web.Response:
         """Start playback of a track."""
         try:
-            body = await request.json()
+            body = await request.json(loads=orjson.loads)
         except Exception:
-            return web.json_response({"error": "Invalid JSON body"}, status=400)
+            return _json_response({"error": "Invalid JSON body"}, status=400)
 
         track_uri = body.get("track_uri")
         player_id = body.get("player_id")
         if not track_uri or not player_id:
-            return web.json_response(
+            return _json_response(
                 {"error": "Missing track_uri or player_id"}, status=400
             )
 
         await self.provider.mass.player_queues.play_media(
             player_id, track_uri, username=await self.provider.get_owner_username()
         )
-        return web.json_response({"status": "ok"})
+        return _ok_response()
 
     async def _handle_pause(self, request: web.Request) -> web.Response:
         """Pause playback."""
         player_id = request.match_info["player_id"]
         self.provider.on_player_activity(player_id)
         await self.provider.mass.players.cmd_pause(player_id)
-        return web.json_response({"status": "ok"})
+        return _ok_response()
 
     async def _handle_stop(self, request: web.Request) -> web.Response:
         """Stop playback."""
         player_id = request.match_info["player_id"]
         self.provider.on_player_activity(player_id)
         await self.provider.mass.players.cmd_stop(player_id)
-        return web.json_response({"status": "ok"})
+        return _ok_response()
 
     async def _handle_quick_stop(self, request: web.Request) -> web.Response:
         """Stop playback on MSX immediately (same signal as Disable)."""
@@ -2204,24 +2447,59 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         accept = request.headers.get("Accept", "")
         if "text/html" in accept:
             return web.Response(status=303, headers={"Location": "/"})
-        return web.json_response({"status": "ok"})
+        return _ok_response()
 
     async def _handle_next(self, request: web.Request) -> web.Response:
         """Skip to next track."""
         player_id = request.match_info["player_id"]
         self.provider.on_player_activity(player_id)
         await self.provider.mass.players.cmd_next_track(player_id)
-        return web.json_response({"status": "ok"})
+        return _ok_response()
 
     async def _handle_previous(self, request: web.Request) -> web.Response:
         """Skip to previous track."""
         player_id = request.match_info["player_id"]
         self.provider.on_player_activity(player_id)
         await self.provider.mass.players.cmd_previous_track(player_id)
-        return web.json_response({"status": "ok"})
+        return _ok_response()
 
     # --- Helpers ---
 
+    def _get_cached_list(
+        self, request: web.Request, key: tuple[Any, ...]
+    ) -> web.Response | None:
+        """Return a cached library list response if still fresh."""
+        cached = self._list_cache.get(key)
+        if cached is None or time.monotonic() - cached[0] >= LIST_CACHE_TTL:
+            return None
+        return _list_response(request, cached[1], cached[2])
+
+    def _cache_list_response(
+        self, request: web.Request, key: tuple[Any, ...], data: dict[str, Any]
+    ) -> web.Response:
+        """Encode a library list response once and keep the bytes for reuse."""
+        return self._cache_list_body(request, key, orjson.dumps(data))
+
+    def _cache_msx_list(
+        self, request: web.Request, key: tuple[Any, ...], content: MsxContent
+    ) -> web.Response:
+        """Serialize an MSX list page once and keep the bytes for reuse."""
+        return self._cache_list_body(request, key, _msx_body(content))
+
+    def _cache_list_body(
+        self, request: web.Request, key: tuple[Any, ...], body: bytes
+    ) -> web.Response:
+        """Store an encoded list body and return it as a JSON response."""
+        if len(self._list_cache) >= LIST_CACHE_MAX_ENTRIES:
+            self._list_cache.clear()
+        etag = _body_etag(body)
+        self._list_cache[key] = (time.monotonic(), body, etag)
+        return _list_response(request, body, etag)
+
+    def _on_library_event(self, event: MassEvent) -> None:  # noqa: ARG002
+        """Drop cached library lists when MA reports a library change."""
+        self._list_cache.clear()
+
     def _get_player_id_and_device_param(self, request: web.Request) -> tuple[str, str]:
         """
         Extract player_id and device_id query param from request.
@@ -2239,7 +2517,7 @@ small {{ color: #666; display: block; margin-top: 4px; }}
         )
         
         if device_id:
-            sanitized = PLAYER_ID_SANITIZE_RE.sub("_", device_id).strip("_") or "device"
+            sanitized = _sanitize_id("_", device_id).strip("_") or "device"
             player_id = f"{MSX_PLAYER_ID_PREFIX}{sanitized}"
             param = f"device_id={quote(device_id, safe='')}"
             logger.info(
@@ -2250,9 +2528,8 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             )
         else:
             ip = remote_ip if remote_ip != "unknown" else "0_0_0_0"
-            sanitized = (
-                PLAYER_ID_SANITIZE_RE.sub("_", ip.replace(".", "_")).strip("_") or "ip"
-            )
+            # "." is outside the allowed class, so dots map to "_" in the same pass
+            sanitized = _sanitize_id("_", ip).strip("_") or "ip"
             player_id = f"{MSX_PLAYER_ID_PREFIX}{sanitized}"
             param = ""
             logger.info(
@@ -2314,8 +2591,6 @@ small {{ color: #666; display: block; margin-top: 4px; }}
             "artist": getattr(track, "artist_str", ""),
             "album": getattr(getattr(track, "album", None), "name", ""),
             "duration": getattr(track, "duration", 0),
-            "image": self.provider.mass.metadata.get_image_url(track.image)
-            if hasattr(track, "image") and track.image
-            else None,
+            "image": get_image_url(track, self.provider),
             "uri": track.uri,
         }
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final
 from urllib.parse import quote
 
 from .models import MsxContent, MsxItem, MsxTemplate
@@ -13,6 +14,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Icons of search result items, keyed by the ``search_kind`` label
+_SEARCH_ICONS: Final = {
+    "Artist": "msx-white-soft:person",
+    "Album": "msx-white-soft:album",
+    "Track": "msx-white-soft:audiotrack",
+}
+
+# Template of the MSX playlist returned by map_tracks_to_msx_playlist
+_TPL_PLAYLIST: Final = MsxTemplate(
+    type="control", layout="0,0,12,1", image_filler="default"
+)
+
 
 def append_device_param(url: str, device_param: str) -> str:
     """Append device_id to URL if present."""
@@ -22,10 +35,36 @@ def append_device_param(url: str, device_param: str) -> str:
     return f"{url}{sep}{device_param}"
 
 
+def _dot_join(first: Any, second: Any) -> str:
+    """Join two footer parts as "first · second", or return whichever is set."""
+    if first and second:
+        return f"{first} · {second}"
+    return str(first or second or "")
+
+
+@lru_cache(maxsize=8192)
+def _quote_uri(uri: str) -> str:
+    """Percent-encode a media URI for a query value (memoized per URI).
+
+    The same track URIs show up across library, search and playlist pages.
+    """
+    return quote(uri, safe="")
+
+
+@lru_cache(maxsize=4096)
+def format_duration(duration: int) -> str:
+    """Format a duration in seconds as ``m:ss`` ("" when unknown).
+
+    Track lengths form a small set of integers, so the strings are memoized.
+    """
+    return f"{duration // 60}:{duration % 60:02d}" if duration else ""
+
+
 def get_image_url(item: Any, provider: MSXBridgeProvider) -> str | None:
     """Get an image URL for a media item."""
-    if hasattr(item, "image") and item.image:
-        return provider.mass.metadata.get_image_url(item.image)
+    # MA's ``image`` is a property scanning the item's metadata; read it once
+    if image := getattr(item, "image", None):
+        return provider.mass.metadata.get_image_url(image)
     return None
 
 
@@ -36,47 +75,61 @@ async def get_album_image_fallback(
     try:
         tracks = await provider.mass.music.albums.tracks(album.item_id, album.provider)
         for track in tracks:
-            if hasattr(track, "image") and track.image:
-                return provider.mass.metadata.get_image_url(track.image)
+            if image := getattr(track, "image", None):
+                return provider.mass.metadata.get_image_url(image)
     except Exception:
         logger.debug("Failed to fetch album image fallback for %s", album.item_id)
     return None
 
 
 async def map_album_to_msx(
-    album: Any, prefix: str, provider: MSXBridgeProvider, device_param: str = ""
+    album: Any,
+    prefix: str,
+    provider: MSXBridgeProvider,
+    device_param: str = "",
+    search_kind: str | None = None,
 ) -> MsxItem:
-    """Map a MA Album to an MSX Item."""
+    """Map a MA Album to an MSX Item.
+
+    With ``search_kind`` the item is labelled as a search result ("Album — Artist").
+    """
     image = get_image_url(album, provider)
     if not image:
         image = await get_album_image_fallback(album, provider)
 
     artist = getattr(album, "artist_str", "")
     year = getattr(album, "year", None)
-    # Build footer: "Artist · 2024" or just one
-    footer: str | None = (
-        f"{artist} · {year}"
-        if artist and year
-        else (artist or (str(year) if year else None))
-    )
+    footer = _dot_join(artist, year) or None
     url = f"{prefix}/msx/albums/{album.item_id}/tracks.json?provider={album.provider}"
+    if device_param:
+        url = f"{url}&{device_param}"
     return MsxItem(
         title=album.name,
         title_footer=footer,
         image=image,
-        action=f"content:{append_device_param(url, device_param)}",
+        action=f"content:{url}",
+        label=f"{search_kind} — {artist}" if search_kind else None,
+        icon=_SEARCH_ICONS.get(search_kind) if search_kind else None,
     )
 
 
 def map_artist_to_msx(
-    artist: Any, prefix: str, provider: MSXBridgeProvider, device_param: str = ""
+    artist: Any,
+    prefix: str,
+    provider: MSXBridgeProvider,
+    device_param: str = "",
+    search_kind: str | None = None,
 ) -> MsxItem:
-    """Map a MA Artist to an MSX Item."""
+    """Map a MA Artist to an MSX Item (labelled ``search_kind`` in search results)."""
     url = f"{prefix}/msx/artists/{artist.item_id}/albums.json"
+    if device_param:
+        url = f"{url}?{device_param}"
     return MsxItem(
         title=artist.name,
         image=get_image_url(artist, provider),
-        action=f"content:{append_device_param(url, device_param)}",
+        action=f"content:{url}",
+        label=search_kind,
+        icon=_SEARCH_ICONS.get(search_kind) if search_kind else None,
     )
 
 
@@ -86,18 +139,33 @@ def map_playlist_to_msx(
     """Map a MA Playlist to an MSX Item."""
     owner = getattr(playlist, "owner", None)
     prov = getattr(playlist, "provider", None)
-    footer: str | None = (
-        f"{owner} · {prov}" if owner and prov else (owner or prov or None)
-    )
+    footer = _dot_join(owner, prov) or None
     url = f"{prefix}/msx/playlists/{playlist.item_id}/tracks.json"
+    if device_param:
+        url = f"{url}?{device_param}"
     return MsxItem(
         title=playlist.name,
         title_footer=footer,
         image=get_image_url(playlist, provider),
-        action=f"content:{append_device_param(url, device_param)}",
+        action=f"content:{url}",
     )
 
 
+def _audio_action_affixes(
+    prefix: str, player_id: str, device_param: str = "", from_playlist: bool = False
+) -> tuple[str, str]:
+    """Return the fixed (head, tail) around the encoded track URI of an audio action.
+
+    Both parts are identical for every track of a list, so callers mapping many
+    tracks compute them once and only quote the per-track URI.
+    """
+    head = f"audio:{prefix}/msx/audio/{player_id}.mp3?uri="
+    tail = "&from_playlist=1" if from_playlist else ""
+    if device_param:
+        tail += f"&{device_param}"
+    return head, tail
+
+
 def _build_audio_action(
     prefix: str,
     player_id: str,
@@ -115,11 +183,8 @@ def _build_audio_action(
     streaming audio to specific Sendspin player IDs.
     """
     # Standard HTTP streaming mode
-    audio_url = f"{prefix}/msx/audio/{player_id}.mp3?uri={quote(track_uri, safe='')}"
-    if from_playlist:
-        audio_url += "&from_playlist=1"
-    audio_url = append_device_param(audio_url, device_param)
-    return f"audio:{audio_url}"
+    head, tail = _audio_action_affixes(prefix, player_id, device_param, from_playlist)
+    return f"{head}{_quote_uri(track_uri)}{tail}"
 
 
 def map_track_to_msx(
@@ -131,19 +196,18 @@ def map_track_to_msx(
     playlist_url: str | None = None,
     sendspin_enabled: bool = False,
     sendspin_server: str = "",
+    search_kind: str | None = None,
 ) -> MsxItem:
-    """Map a MA Track to an MSX Item."""
+    """Map a MA Track to an MSX Item.
+
+    With ``search_kind`` the item is labelled as a search result ("Track — Artist").
+    """
     duration = getattr(track, "duration", 0) or 0
-    duration_str = f"{duration // 60}:{duration % 60:02d}" if duration else ""
+    duration_str = format_duration(duration)
     artist = getattr(track, "artist_str", "")
     image_url = get_image_url(track, provider)
 
-    # Build footer: "Artist · 3:42" or just one of them
-    footer: str | None = (
-        f"{artist} · {duration_str}"
-        if artist and duration_str
-        else (artist or duration_str or None)
-    )
+    footer = _dot_join(artist, duration_str) or None
 
     if playlist_url:
         # playlist: (not auto:) loads the playlist and executes the content
@@ -169,6 +233,8 @@ def map_track_to_msx(
         image=image_url,
         background=image_url,
         action=action,
+        label=f"{search_kind} — {artist}" if search_kind else None,
+        icon=_SEARCH_ICONS.get(search_kind) if search_kind else None,
     )
 
 
@@ -179,8 +245,8 @@ def map_tracks_to_msx_playlist(
     player_id: str,
     provider: MSXBridgeProvider,
     device_param: str = "",
-    sendspin_enabled: bool = False,
-    sendspin_server: str = "",
+    sendspin_enabled: bool = False,  # noqa: ARG001 - reserved for future use
+    sendspin_server: str = "",  # noqa: ARG001 - reserved for future use
 ) -> MsxContent:
     """Map a list of MA Track objects to an MSX Content page for playlist playback.
 
@@ -188,27 +254,18 @@ def map_tracks_to_msx_playlist(
     Each item uses ``action: "audio:{URL}"`` so MSX can play them sequentially.
     The page-level ``action`` auto-starts playback at the requested track index.
     """
+    action_head, action_tail = _audio_action_affixes(
+        prefix, player_id, device_param, from_playlist=True
+    )
     msx_items = []
     for track in tracks:
         duration = getattr(track, "duration", 0) or 0
-        duration_str = f"{duration // 60}:{duration % 60:02d}" if duration else ""
+        duration_str = format_duration(duration)
         artist = getattr(track, "artist_str", "")
-        label = (
-            f"{artist} · {duration_str}"
-            if artist and duration_str
-            else artist or duration_str
-        )
+        label = _dot_join(artist, duration_str)
         image_url = get_image_url(track, provider)
 
-        action = _build_audio_action(
-            prefix=prefix,
-            player_id=player_id,
-            track_uri=track.uri,
-            device_param=device_param,
-            sendspin_enabled=sendspin_enabled,
-            sendspin_server=sendspin_server,
-            from_playlist=True,
-        )
+        action = f"{action_head}{_quote_uri(track.uri)}{action_tail}"
 
         msx_items.append(
             MsxItem(
@@ -230,11 +287,7 @@ def map_tracks_to_msx_playlist(
 
     return MsxContent(
         type="list",
-        template=MsxTemplate(
-            type="control",
-            layout="0,0,12,1",
-            image_filler="default",
-        ),
+        template=_TPL_PLAYLIST,
         items=msx_items,
         action="player:play",
     )
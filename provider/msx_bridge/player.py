@@ -4,13 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from music_assistant_models.enums import PlaybackState, PlayerFeature, PlayerType
 from music_assistant_models.player import DeviceInfo
 
 from music_assistant.models.player import Player, PlayerMedia
 
+from .constants import (
+    POLL_GREEDY_COUNT,
+    POLL_INTERVAL_IDLE,
+    POLL_INTERVAL_IDLE_STEADY,
+    POLL_INTERVAL_PLAYING,
+    POLL_INTERVAL_PLAYING_STEADY,
+)
+
 if TYPE_CHECKING:
     from .provider import MSXBridgeProvider
 
@@ -26,8 +34,13 @@ class MSXPlayer(Player):
     _queue_source_id: str | None = None
     _playlist_offset: int = 0
     _playlist_size: int = 0
+    _playlist_fingerprint: int = 0
     _media_ready: asyncio.Event
+    _msx_provider: MSXBridgeProvider
+    _next_action: str
+    _prev_action: str
     _last_ws_position: float | None = None
+    _stable_polls: int = 0
 
     def __init__(
         self,
@@ -40,6 +53,11 @@ class MSXPlayer(Player):
     ) -> None:
         """Initialize the MSX Player."""
         super().__init__(provider, player_id)
+        # Typed handle on the owning provider (Player.provider is the base type)
+        self._msx_provider = provider
+        # MSX interaction actions for direct streams; player_id never changes
+        self._next_action = f"request:interaction:/api/next/{player_id}"
+        self._prev_action = f"request:interaction:/api/previous/{player_id}"
         self._attr_name = name
         self._attr_type = PlayerType.PLAYER
         self._attr_supported_features = {
@@ -59,6 +77,11 @@ class MSXPlayer(Player):
         self.output_format = output_format
         self._media_ready = asyncio.Event()
 
+    @property
+    def has_media(self) -> bool:
+        """Return True while play_media() media is set and not stopped since."""
+        return self._media_ready.is_set()
+
     @property
     def requires_flow_mode(self) -> bool:
         """MSX plays individual tracks — flow mode breaks progress tracking."""
@@ -71,8 +94,16 @@ class MSXPlayer(Player):
 
     @property
     def poll_interval(self) -> int:
-        """Return poll interval in seconds."""
-        return 5 if self.playback_state == PlaybackState.PLAYING else 30
+        """Return poll interval in seconds.
+
+        Polls quickly right after a playback state change, then backs off once
+        the state has held for POLL_GREEDY_COUNT polls (MA extrapolates elapsed
+        time between polls, so steady playback needs few updates).
+        """
+        steady = self._stable_polls >= POLL_GREEDY_COUNT
+        if self.playback_state == PlaybackState.PLAYING:
+            return POLL_INTERVAL_PLAYING_STEADY if steady else POLL_INTERVAL_PLAYING
+        return POLL_INTERVAL_IDLE_STEADY if steady else POLL_INTERVAL_IDLE
 
     async def play_media(self, media: PlayerMedia) -> None:
         """Handle PLAY MEDIA command — store stream URL for the TV to fetch."""
@@ -81,6 +112,7 @@ class MSXPlayer(Player):
         self._attr_current_media = media
         self._media_ready.set()
         self._attr_playback_state = PlaybackState.PLAYING
+        self._stable_polls = 0
         self._attr_elapsed_time = 0.0
         self._attr_elapsed_time_last_updated = time.time()
         self._last_ws_position = None
@@ -96,7 +128,7 @@ class MSXPlayer(Player):
         source_id = media.source_id
         is_queue_backed = bool(source_id and media.queue_item_id)
         is_same_queue = self._playing_from_queue and self._queue_source_id == source_id
-        provider = cast("MSXBridgeProvider", self.provider)
+        provider = self._msx_provider
 
         if is_queue_backed and is_same_queue and source_id:
             self._notify_same_queue(provider, source_id)
@@ -104,16 +136,14 @@ class MSXPlayer(Player):
             self._notify_new_queue(provider, source_id)
         else:
             title, artist, image_url, duration = self._resolve_media_metadata(media)
-            next_action = f"request:interaction:/api/next/{self.player_id}"
-            prev_action = f"request:interaction:/api/previous/{self.player_id}"
             provider.notify_play_started(
                 self.player_id,
                 title=title,
                 artist=artist,
                 image_url=image_url,
                 duration=duration,
-                next_action=next_action,
-                prev_action=prev_action,
+                next_action=self._next_action,
+                prev_action=self._prev_action,
             )
 
     def _notify_same_queue(self, provider: MSXBridgeProvider, source_id: str) -> None:
@@ -121,11 +151,16 @@ class MSXPlayer(Player):
         queue = self.mass.player_queues.get(source_id)
         ma_index = getattr(queue, "current_index", 0) if queue else 0
         try:
-            current_size = len(list(self.mass.player_queues.items(source_id)))
+            current_size, fingerprint = self._queue_state(source_id)
         except Exception:
-            current_size = self._playlist_size
-        if current_size != self._playlist_size:
+            current_size, fingerprint = self._playlist_size, self._playlist_fingerprint
+        # A same-size reorder (e.g. shuffle) also invalidates the MSX playlist
+        if (
+            current_size != self._playlist_size
+            or fingerprint != self._playlist_fingerprint
+        ):
             self._playlist_size = current_size
+            self._playlist_fingerprint = fingerprint
             self._playlist_offset = ma_index
             provider.notify_play_playlist(self.player_id, ma_index, queue_id=source_id)
         else:
@@ -140,14 +175,29 @@ class MSXPlayer(Player):
         queue = self.mass.player_queues.get(source_id)
         start_index = getattr(queue, "current_index", 0) if queue else 0
         try:
-            self._playlist_size = len(list(self.mass.player_queues.items(source_id)))
+            self._playlist_size, self._playlist_fingerprint = self._queue_state(
+                source_id
+            )
         except Exception:
-            self._playlist_size = 0
+            self._playlist_size, self._playlist_fingerprint = 0, 0
         self._playlist_offset = start_index
         self._queue_source_id = source_id
         provider.notify_play_playlist(self.player_id, start_index, queue_id=source_id)
         self._playing_from_queue = True
 
+    def _queue_state(self, source_id: str) -> tuple[int, int]:
+        """Return (size, fingerprint) of the items the queue's MSX playlist holds.
+
+        Based on what ``player_queues.items()`` yields (the playlist endpoint
+        serves the same items). The fingerprint hashes the queue item ids in
+        order, so reordering the queue changes it even when the size doesn't.
+        """
+        ids = tuple(
+            getattr(item, "queue_item_id", None)
+            for item in self.mass.player_queues.items(source_id)
+        )
+        return len(ids), hash(ids)
+
     def _resolve_media_metadata(
         self, media: PlayerMedia
     ) -> tuple[str | None, str | None, str | None, int | None]:
@@ -161,14 +211,11 @@ class MSXPlayer(Player):
                 media.source_id, media.queue_item_id
             )
             if queue_item:
-                if queue_item.media_item:
-                    title = getattr(queue_item.media_item, "name", None) or title
-                    artist = (
-                        getattr(queue_item.media_item, "artist_str", None) or artist
-                    )
-                    duration = (
-                        getattr(queue_item.media_item, "duration", None) or duration
-                    )
+                if media_item := queue_item.media_item:
+                    title = media_item.name or title
+                    # Only some playable types (tracks, episodes...) carry these
+                    artist = getattr(media_item, "artist_str", None) or artist
+                    duration = getattr(media_item, "duration", None) or duration
                 if queue_item.image:
                     image_url = self.mass.metadata.get_image_url(
                         queue_item.image, size=500, prefer_stream_server=True
@@ -192,8 +239,11 @@ class MSXPlayer(Player):
 
     async def _propagate_to_group_members(self, command: str, **kwargs: Any) -> None:
         """Propagate command to group members in parallel when we are the leader."""
+        # Solo players (the common case) have nothing to propagate
+        if not self.group_members:
+            return
         # Skip if grouping is disabled at provider level
-        provider = cast("MSXBridgeProvider", self.provider)
+        provider = self._msx_provider
         if not provider.grouping_enabled:
             return
         # Prevent infinite recursion if member.play_media triggers propagation back
@@ -251,14 +301,18 @@ class MSXPlayer(Player):
         player_ids_to_remove: list[str] | None = None,
     ) -> None:
         """Handle SET_MEMBERS — update group membership."""
-        for pid in player_ids_to_remove or []:
-            if pid in self._attr_group_members:
-                self._attr_group_members.remove(pid)
+        # Diff against a set once; the list is updated in place to keep order
+        members = self._attr_group_members
+        if player_ids_to_remove:
+            removed = set(player_ids_to_remove)
+            members[:] = [pid for pid in members if pid not in removed]
+        current = set(members)
         for pid in player_ids_to_add or []:
-            if pid != self.player_id and pid not in self._attr_group_members:
+            if pid != self.player_id and pid not in current:
                 other = self.mass.players.get(pid)
                 if other and isinstance(other, MSXPlayer):
-                    self._attr_group_members.append(pid)
+                    members.append(pid)
+                    current.add(pid)
         self.update_state()
 
     async def play(self) -> None:
@@ -268,6 +322,7 @@ class MSXPlayer(Player):
             await self._resume_from_pause()
             return
         self._attr_playback_state = PlaybackState.PLAYING
+        self._stable_polls = 0
         self._attr_elapsed_time_last_updated = time.time()
         self.update_state()
         await self._propagate_to_group_members("play")
@@ -282,11 +337,12 @@ class MSXPlayer(Player):
         for reliable long-pause support.
         """
         self._attr_playback_state = PlaybackState.PLAYING
+        self._stable_polls = 0
         self._attr_elapsed_time_last_updated = time.time()
         self._last_ws_position = None
         self.update_state()
         if not self._skip_ws_notify:
-            cast("MSXBridgeProvider", self.provider).notify_play_resumed(self.player_id)
+            self._msx_provider.notify_play_resumed(self.player_id)
         await self._propagate_to_group_members("play")
 
     async def pause(self) -> None:
@@ -301,16 +357,18 @@ class MSXPlayer(Player):
                 time.time() - self._attr_elapsed_time_last_updated
             )
         self._attr_playback_state = PlaybackState.PAUSED
+        self._stable_polls = 0
         self._attr_elapsed_time_last_updated = time.time()
         self.update_state()
         if not self._skip_ws_notify:
-            cast("MSXBridgeProvider", self.provider).notify_play_paused(self.player_id)
+            self._msx_provider.notify_play_paused(self.player_id)
         await self._propagate_to_group_members("pause")
 
     async def stop(self) -> None:
         """Handle STOP command."""
         self.logger.info("stop on %s", self.display_name)
         self._attr_playback_state = PlaybackState.IDLE
+        self._stable_polls = 0
         self._attr_current_media = None
         self._media_ready.clear()
         self._attr_elapsed_time = None
@@ -321,13 +379,16 @@ class MSXPlayer(Player):
         self._queue_source_id = None
         self._playlist_offset = 0
         self._playlist_size = 0
+        self._playlist_fingerprint = 0
         self.update_state()
-        provider = cast("MSXBridgeProvider", self.provider)
+        provider = self._msx_provider
         provider.notify_play_stopped(self.player_id)
         await self._propagate_to_group_members("stop")
 
     async def volume_set(self, volume_level: int) -> None:
         """Handle VOLUME_SET command."""
+        if volume_level == self._attr_volume_level:
+            return
         self._attr_volume_level = volume_level
         self.update_state()
 
@@ -350,6 +411,7 @@ class MSXPlayer(Player):
         If a recent WebSocket position report was received (within 10s),
         skip wall-clock increment — the WS data is more accurate.
         """
+        self._stable_polls += 1
         if (
             self._attr_playback_state == PlaybackState.PLAYING
             and self._attr_elapsed_time is not None
@@ -359,6 +421,10 @@ class MSXPlayer(Player):
             if self._last_ws_position and (time.time() - self._last_ws_position) < 10:
                 return
             now = time.time()
+            # MA extrapolates elapsed time itself; sub-second drift isn't worth
+            # a state broadcast (polls can also run right after a state change)
+            if now - self._attr_elapsed_time_last_updated < 1.0:
+                return
             self._attr_elapsed_time += now - self._attr_elapsed_time_last_updated
             self._attr_elapsed_time_last_updated = now
             self.update_state()
@@ -366,15 +432,13 @@ class MSXPlayer(Player):
     async def wait_for_media(self, timeout: float = 10.0) -> PlayerMedia | None:
         """Wait for play_media() to set current_media, with timeout.
 
-        Fast path: if play_media() already ran (e.g. during queue.play_media),
-        current_media is set — return immediately without waiting.
-        Slow path: clear the event and wait for play_media() to signal.
+        The event is owned by the producer side: play_media() sets it and
+        stop() clears it, so waiters only ever wait on it. If play_media()
+        already ran (e.g. during queue.play_media) this returns immediately.
         """
-        if self._attr_current_media is not None and self._media_ready.is_set():
-            return self._attr_current_media
-        self._media_ready.clear()
-        try:
-            await asyncio.wait_for(self._media_ready.wait(), timeout=timeout)
-        except TimeoutError:
-            return None
+        if not self._media_ready.is_set():
+            try:
+                await asyncio.wait_for(self._media_ready.wait(), timeout=timeout)
+            except TimeoutError:
+                return None
         return self._attr_current_media
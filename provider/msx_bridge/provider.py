@@ -8,7 +8,7 @@ import logging
 import time
 from collections import deque
 from collections.abc import AsyncIterator
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from music_assistant.models.player_provider import PlayerProvider
 
@@ -32,6 +32,9 @@ from .constants import (
 from .http_server import MSXHTTPServer
 from .player import MSXPlayer
 
+if TYPE_CHECKING:
+    from music_assistant.models.player import Player
+
 logger = logging.getLogger(__name__)
 
 
@@ -240,6 +243,7 @@ class MSXBridgeProvider(PlayerProvider):
     _timeout_task: asyncio.Task[None] | None = None
     _owner_username: str | None = None
     _shared_streams: dict[str, SharedGroupStream]  # group_id -> SharedGroupStream
+    _shared_stream_waiters: dict[str, asyncio.Event]  # set when a stream is created
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the provider."""
@@ -247,6 +251,7 @@ class MSXBridgeProvider(PlayerProvider):
         self._player_last_activity = {}
         self._pending_unregisters = {}
         self._shared_streams = {}
+        self._shared_stream_waiters = {}
 
     async def handle_async_init(self) -> None:
         """Handle async initialization — start embedded HTTP server."""
@@ -286,15 +291,21 @@ class MSXBridgeProvider(PlayerProvider):
 
         if self.http_server:
             await self.http_server.stop()
-        for player in list(self.players):
-            try:
-                self.logger.debug("Unloading player %s", player.display_name)
-                await self.mass.players.unregister(player.player_id)
-            except Exception:
-                self.logger.exception("Error unregistering player %s", player.player_id)
+        # Snapshot first: unregister() removes players from self.players
+        await asyncio.gather(
+            *(self._unregister_player(player) for player in list(self.players))
+        )
         self._player_last_activity.clear()
         self.logger.info("MSX Bridge provider unloaded")
 
+    async def _unregister_player(self, player: Player) -> None:
+        """Unregister one player on unload, logging (not raising) failures."""
+        try:
+            self.logger.debug("Unloading player %s", player.display_name)
+            await self.mass.players.unregister(player.player_id)
+        except Exception:
+            self.logger.exception("Error unregistering player %s", player.player_id)
+
     async def get_owner_username(self) -> str | None:
         """Resolve and cache the first non-system user's username for playlog attribution."""
         if self._owner_username is None:
@@ -612,9 +623,28 @@ class MSXBridgeProvider(PlayerProvider):
         stream = SharedGroupStream(group_id, media_uri)
         await stream.start(audio_chunks)
         self._shared_streams[group_id] = stream
+        if waiters := self._shared_stream_waiters.pop(group_id, None):
+            waiters.set()
 
         return stream
 
+    async def wait_for_shared_stream(
+        self, group_id: str, timeout: float
+    ) -> SharedGroupStream | None:
+        """Wait for the group leader to create a live shared stream.
+
+        Returns None if no stream was created within ``timeout`` seconds.
+        """
+        stream = self._shared_streams.get(group_id)
+        if stream is None or stream.finished:
+            event = self._shared_stream_waiters.setdefault(group_id, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            except TimeoutError:
+                return None
+            stream = self._shared_streams.get(group_id)
+        return stream if stream and not stream.finished else None
+
     def remove_shared_stream(self, group_id: str) -> None:
         """Remove and cleanup shared stream for a group."""
         if stream := self._shared_streams.pop(group_id, None):
@@ -290,6 +290,30 @@ async def test_provider_get_or_create_shared_stream(
     await stream.stop()
 
 
+async def test_provider_wait_for_shared_stream(provider: MSXBridgeProvider) -> None:
+    """A group member waiting for the leader wakes up when the stream is created."""
+
+    async def chunk_gen() -> AsyncIterator[bytes]:
+        yield b"test"
+        await asyncio.sleep(10)
+
+    waiter = asyncio.create_task(provider.wait_for_shared_stream("group_1", 1.0))
+    await asyncio.sleep(0)
+    stream = await provider.get_or_create_shared_stream(
+        "group_1", "http://example.com/track.mp3", chunk_gen()
+    )
+
+    assert await waiter is stream
+    await stream.stop()
+
+
+async def test_provider_wait_for_shared_stream_timeout(
+    provider: MSXBridgeProvider,
+) -> None:
+    """wait_for_shared_stream should return None when no leader shows up."""
+    assert await provider.wait_for_shared_stream("group_1", 0.05) is None
+
+
 async def test_provider_reuse_existing_shared_stream(
     provider: MSXBridgeProvider,
 ) -> None:
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from weakref import WeakSet
 
 import pytest
 from aiohttp.test_utils import TestClient as AiohttpTestClient
-from aiohttp.test_utils import TestServer
+from aiohttp.test_utils import TestServer, make_mocked_request
+from multidict import MultiDict
 from music_assistant_models.enums import PlaybackState
 from music_assistant_models.player import PlayerMedia
 
-from music_assistant.providers.msx_bridge.http_server import MSXHTTPServer
+from music_assistant.providers.msx_bridge.constants import MAX_PAD_BYTES
+from music_assistant.providers.msx_bridge.http_server import (
+    MSXHTTPServer,
+    _drain_ready,
+    _page_params,
+    _PlayerConnections,
+    _result_total,
+)
 from music_assistant.providers.msx_bridge.mappers import map_track_to_msx
 from music_assistant.providers.msx_bridge.player import MSXPlayer
 from music_assistant.providers.msx_bridge.provider import MSXBridgeProvider
@@ -36,7 +46,7 @@ async def test_root_html(http_client: TestClient[Any, Any]) -> None:
     """GET / should return 200 with text/html content."""
     resp = await http_client.get("/")
     assert resp.status == 200
-    assert "text/html" in resp.headers["Content-Type"]
+    assert resp.headers["Content-Type"] == "text/html; charset=utf-8"
     body = await resp.text()
     assert "MSX" in body
 
@@ -71,12 +81,59 @@ async def test_tvx_lib(http_client: TestClient[Any, Any]) -> None:
     assert "javascript" in resp.headers["Content-Type"]
 
 
+async def test_tvx_lib_revalidates_by_etag(http_client: TestClient[Any, Any]) -> None:
+    """The vendored TVX library is cacheable and answers If-None-Match with 304."""
+    resp = await http_client.get("/msx/tvx-plugin-module.min.js")
+    assert resp.headers["Cache-Control"] == "public, max-age=86400"
+    etag = resp.headers["ETag"]
+
+    resp = await http_client.get(
+        "/msx/tvx-plugin-module.min.js", headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+
+
+async def test_plugin_html_rendered_once_per_host(
+    provider: MSXBridgeProvider,
+) -> None:
+    """plugin.html is rendered once per host and served from memory afterwards."""
+    server = MSXHTTPServer(provider, 0)
+    client = AiohttpTestClient(TestServer(server.app))
+    await client.start_server()
+    try:
+        with patch.object(
+            server, "_render_plugin_html", wraps=server._render_plugin_html
+        ) as render:
+            first = await (await client.get("/msx/plugin.html")).text()
+            second = await (await client.get("/msx/plugin.html")).text()
+        assert first == second
+        render.assert_called_once()
+    finally:
+        await client.close()
+
+
 async def test_cors_headers(http_client: TestClient[Any, Any]) -> None:
     """Responses should include CORS Access-Control-Allow-Origin header."""
     resp = await http_client.get("/health")
     assert resp.headers.get("Access-Control-Allow-Origin") == "*"
 
 
+async def test_cors_preflight_skips_handler(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """OPTIONS is answered by the middleware without running the route handler."""
+    server = MSXHTTPServer(provider, 0)
+    client = AiohttpTestClient(TestServer(server.app))
+    await client.start_server()
+    try:
+        resp = await client.options("/api/pause/msx_test")
+        assert resp.status == 200
+        assert resp.headers["Access-Control-Allow-Methods"] == "GET, POST, OPTIONS"
+        mass_mock.players.cmd_pause.assert_not_awaited()
+    finally:
+        await client.close()
+
+
 # --- Stream proxy ---
 
 
@@ -201,6 +258,54 @@ async def test_albums_with_data(provider: MSXBridgeProvider, mass_mock: Mock) ->
         await client.close()
 
 
+async def test_albums_cached_until_library_event(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """Repeat /api/albums calls are served from cache until the library changes."""
+    server = MSXHTTPServer(provider, 0)
+    client = AiohttpTestClient(TestServer(server.app))
+    await client.start_server()
+    try:
+        for _ in range(2):
+            resp = await client.get("/api/albums?limit=10&offset=0")
+            assert resp.status == 200
+        assert mass_mock.music.albums.library_items.await_count == 1
+
+        server._on_library_event(Mock())
+        resp = await client.get("/api/albums?limit=10&offset=0")
+        assert resp.status == 200
+        assert mass_mock.music.albums.library_items.await_count == 2
+    finally:
+        await client.close()
+
+
+async def test_albums_item_shape(provider: MSXBridgeProvider, mass_mock: Mock) -> None:
+    """Album entries keep the documented JSON keys."""
+    album = Mock(item_id=7, uri="library://album/7", artist_str="Artist", image=None)
+    album.name = "Album"
+    mass_mock.music.albums.library_items = AsyncMock(return_value=[album])
+    server = MSXHTTPServer(provider, 0)
+    client = AiohttpTestClient(TestServer(server.app))
+    await client.start_server()
+    try:
+        resp = await client.get("/api/albums")
+        data = await resp.json()
+        assert data == {
+            "items": [
+                {
+                    "item_id": "7",
+                    "name": "Album",
+                    "image": None,
+                    "uri": "library://album/7",
+                    "artist": "Artist",
+                }
+            ],
+            "total": 1,
+        }
+    finally:
+        await client.close()
+
+
 async def test_album_tracks(http_client: TestClient[Any, Any]) -> None:
     """GET /api/albums/{id}/tracks should return items list."""
     resp = await http_client.get("/api/albums/1/tracks")
@@ -254,6 +359,28 @@ async def test_search(provider: MSXBridgeProvider, mass_mock: Mock) -> None:
         await client.close()
 
 
+async def test_build_search_items_keeps_album_order(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """Album items mapped concurrently should keep search order and labels."""
+    albums = []
+    for idx in range(3):
+        album = Mock(item_id=str(idx), provider="library", artist_str=f"A{idx}")
+        album.name = f"Album {idx}"
+        album.image = None
+        albums.append(album)
+    mass_mock.music.search = AsyncMock(
+        return_value=Mock(artists=[], albums=albums, tracks=[], playlists=[])
+    )
+    server = MSXHTTPServer(provider, 0)
+
+    items = await server._build_search_items("q", 20, "msx_1", "", "http://h")
+
+    assert [i.title for i in items] == ["Album 0", "Album 1", "Album 2"]
+    assert items[2].label == "Album — A2"
+    assert mass_mock.music.albums.tracks.await_count == 3
+
+
 async def test_search_missing_query(http_client: TestClient[Any, Any]) -> None:
     """GET /api/search without q parameter should return 400."""
     resp = await http_client.get("/api/search")
@@ -409,6 +536,75 @@ async def test_msx_albums_have_action(
         await client.close()
 
 
+async def test_msx_albums_page_cached_per_device(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """MSX album pages are reused per device and dropped on library events."""
+    server = MSXHTTPServer(provider, 0)
+    client = AiohttpTestClient(TestServer(server.app))
+    await client.start_server()
+    try:
+        for _ in range(2):
+            resp = await client.get("/msx/albums.json?device_id=tv1")
+            assert resp.status == 200
+        assert mass_mock.music.albums.library_items.await_count == 1
+
+        resp = await client.get("/msx/albums.json?device_id=tv2")
+        assert resp.status == 200
+        assert mass_mock.music.albums.library_items.await_count == 2
+
+        server._on_library_event(Mock())
+        resp = await client.get("/msx/albums.json?device_id=tv1")
+        assert resp.status == 200
+        assert mass_mock.music.albums.library_items.await_count == 3
+    finally:
+        await client.close()
+
+
+async def test_msx_list_not_modified_by_etag(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """A listing revalidated with its ETag answers 304 without a body."""
+    server = MSXHTTPServer(provider, 0)
+    client = AiohttpTestClient(TestServer(server.app))
+    await client.start_server()
+    try:
+        resp = await client.get("/msx/artists.json")
+        assert resp.status == 200
+        etag = resp.headers["ETag"]
+
+        resp = await client.get("/msx/artists.json", headers={"If-None-Match": etag})
+        assert resp.status == 304
+        assert resp.headers["ETag"] == etag
+        assert await resp.read() == b""
+
+        resp = await client.get(
+            "/msx/artists.json", headers={"If-None-Match": '"stale"'}
+        )
+        assert resp.status == 200
+    finally:
+        await client.close()
+
+
+async def test_recently_played_revalidates_by_etag(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """Recently played is always re-queried but answers 304 when unchanged."""
+    server = MSXHTTPServer(provider, 0)
+    client = AiohttpTestClient(TestServer(server.app))
+    await client.start_server()
+    try:
+        resp = await client.get("/api/recently-played")
+        assert resp.status == 200
+        etag = resp.headers["ETag"]
+
+        resp = await client.get("/api/recently-played", headers={"If-None-Match": etag})
+        assert resp.status == 304
+        assert mass_mock.music.tracks.library_items.await_count == 2
+    finally:
+        await client.close()
+
+
 async def test_msx_artists_have_action(
     provider: MSXBridgeProvider, mass_mock: Mock
 ) -> None:
@@ -804,6 +1000,141 @@ def test_format_msx_track_duration_only(provider: MSXBridgeProvider) -> None:
     assert item.title_footer == "3:00"
 
 
+# --- Audio stream sizing ---
+
+
+def test_page_params_defaults_and_clamping() -> None:
+    """Paging params fall back to defaults and are clamped to a sane range."""
+    assert _page_params(MultiDict()) == (50, 0)
+    assert _page_params(MultiDict(limit="20", offset="40")) == (20, 40)
+    assert _page_params(MultiDict(limit="abc", offset="-5")) == (50, 0)
+    assert _page_params(MultiDict(limit="999999"), default_limit=20) == (10000, 0)
+
+
+def test_result_total_prefers_paged_total() -> None:
+    """Paged results report their library total; plain lists their length."""
+    paged = MagicMock()
+    paged.total = 120
+    assert _result_total(paged) == 120
+    assert _result_total([1, 2, 3]) == 3
+
+
+def test_build_audio_params_content_length_not_in_headers() -> None:
+    """Estimated size is returned separately, not as a raw header."""
+    _pcm, _out, headers, content_length = MSXHTTPServer._build_audio_params("mp3", 180)
+    assert "Content-Length" not in headers
+    assert content_length == 180 * 40_000
+
+
+def test_build_audio_params_reuses_header_template() -> None:
+    """Stream headers are shared per format; responses get their own copy."""
+    _pcm, _out, headers, _len = MSXHTTPServer._build_audio_params("aac", 180)
+    _pcm, _out, again, _len = MSXHTTPServer._build_audio_params("aac", 60)
+    assert headers is again
+    assert headers["Content-Type"] == "audio/aac"
+
+    response = MSXHTTPServer._new_stream_response(headers, None)
+    response.headers["Access-Control-Allow-Origin"] = "*"
+    assert "Access-Control-Allow-Origin" not in headers
+
+
+def test_build_audio_params_flac_unsized() -> None:
+    """FLAC has no fixed bitrate, so no Content-Length is estimated."""
+    _pcm, _out, _headers, content_length = MSXHTTPServer._build_audio_params(
+        "flac", 180
+    )
+    assert content_length is None
+
+
+def test_new_stream_response_sets_content_length() -> None:
+    """Sized stream responses expose content_length before prepare()."""
+    response = MSXHTTPServer._new_stream_response({"Content-Type": "audio/mpeg"}, 1234)
+    assert response.content_length == 1234
+    assert not response.chunked
+
+
+def _sized_response(content_length: int | None) -> Mock:
+    """Mock StreamResponse that records the bytes written to it."""
+    response = Mock(content_length=content_length, prepare=AsyncMock())
+    response.body = bytearray()
+    response.write = AsyncMock(side_effect=response.body.extend)
+    return response
+
+
+async def _prebuffer_stream(
+    provider: MSXBridgeProvider, response: Mock, chunks: list[bytes]
+) -> None:
+    """Run _stream_with_prebuffer over ``chunks`` as the encoded output."""
+    server = MSXHTTPServer(provider, 0)
+    pcm_format, out_format, _headers, _len = MSXHTTPServer._build_audio_params(
+        "mp3", 180
+    )
+    with patch(
+        "music_assistant.providers.msx_bridge.http_server.get_ffmpeg_stream",
+        return_value=_async_iter(chunks),
+    ):
+        await server._stream_with_prebuffer(
+            Mock(), response, Mock(player_id="msx_test"), Mock(), pcm_format, out_format
+        )
+
+
+async def test_prebuffer_pads_short_body_to_content_length(
+    provider: MSXBridgeProvider,
+) -> None:
+    """A small ffmpeg shortfall is padded with zeros up to Content-Length."""
+    response = _sized_response(1000)
+    await _prebuffer_stream(provider, response, [b"a" * 300, b"b" * 200])
+
+    assert len(response.body) == 1000
+    assert response.body[:500] == b"a" * 300 + b"b" * 200
+    assert response.body[500:] == bytes(500)
+    response.force_close.assert_not_called()
+
+
+async def test_prebuffer_closes_when_far_short(provider: MSXBridgeProvider) -> None:
+    """A shortfall beyond MAX_PAD_BYTES closes the connection instead of padding."""
+    response = _sized_response(MAX_PAD_BYTES + 1000)
+    await _prebuffer_stream(provider, response, [b"a" * 500])
+
+    assert response.body == b"a" * 500
+    response.force_close.assert_called_once()
+
+
+async def test_prebuffer_leaves_unsized_body(provider: MSXBridgeProvider) -> None:
+    """Unsized (FLAC) bodies end with whatever ffmpeg produced."""
+    response = _sized_response(None)
+    await _prebuffer_stream(provider, response, [b"a" * 500])
+
+    assert response.body == b"a" * 500
+    response.force_close.assert_not_called()
+
+
+async def test_shared_stream_pads_short_body(provider: MSXBridgeProvider) -> None:
+    """Shared group streams finish sized bodies like independent ones."""
+    server = MSXHTTPServer(provider, 0)
+    pcm_format, out_format, headers, _len = MSXHTTPServer._build_audio_params(
+        "mp3", 180
+    )
+    provider._shared_streams["msx_leader"] = Mock(
+        finished=False, subscribe=Mock(return_value=_async_iter([b"a" * 300]))
+    )
+    response = _sized_response(1000)
+    with patch.object(MSXHTTPServer, "_new_stream_response", return_value=response):
+        await server._serve_shared_stream(
+            Mock(),
+            Mock(player_id="msx_member"),
+            Mock(uri="library://track/1"),
+            "msx_leader",
+            pcm_format,
+            out_format,
+            headers,
+            1000,
+        )
+
+    assert response.body == b"a" * 300 + bytes(700)
+    response.force_close.assert_not_called()
+
+
 # --- Async iteration helpers for stream mocking ---
 
 
@@ -983,6 +1314,141 @@ async def test_ws_unknown_message_type(provider: MSXBridgeProvider) -> None:
     provider.http_server._handle_ws_message("msx_test", '{"type": "unknown_cmd"}')  # type: ignore[attr-defined]
 
 
+async def test_drain_ready_joins_queued_tail() -> None:
+    """Queued chunks up to the EOF sentinel should be joined into one write."""
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    assert _drain_ready(queue, b"a") == (b"a", False)
+
+    for item in (b"b", b"c", None):
+        queue.put_nowait(item)
+    assert _drain_ready(queue, b"a") == (b"abc", True)
+    assert queue.empty()
+
+
+async def test_broadcast_uses_single_task(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """Broadcast should schedule one task that sends to every open client."""
+    server = MSXHTTPServer(provider, 0)
+    ws1 = Mock(closed=False, send_str=AsyncMock())
+    ws2 = Mock(closed=False, send_str=AsyncMock(side_effect=ConnectionResetError))
+    ws_closed = Mock(closed=True, send_str=AsyncMock())
+    server._connections["msx_test"] = _PlayerConnections(
+        ws=WeakSet([ws1, ws2, ws_closed])
+    )
+    tasks: list[asyncio.Task[None]] = []
+    mass_mock.create_task = Mock(
+        side_effect=lambda coro: tasks.append(asyncio.ensure_future(coro))
+    )
+
+    server.broadcast_pause("msx_test")
+
+    assert mass_mock.create_task.call_count == 1
+    await asyncio.gather(*tasks)
+    ws1.send_str.assert_awaited_once_with('{"type":"pause"}')
+    ws2.send_str.assert_awaited_once()
+    ws_closed.send_str.assert_not_awaited()
+
+
+async def test_broadcast_stop_encodes_message_once(
+    provider: MSXBridgeProvider, mass_mock: Mock, config_mock: Mock
+) -> None:
+    """The stop message is built from config once and reused afterwards."""
+    server = MSXHTTPServer(provider, 0)
+    ws = Mock(closed=False, send_str=AsyncMock())
+    server._connections["msx_test"] = _PlayerConnections(ws=WeakSet([ws]))
+    tasks: list[asyncio.Task[None]] = []
+    mass_mock.create_task = Mock(
+        side_effect=lambda coro: tasks.append(asyncio.ensure_future(coro))
+    )
+    config_mock.get_value.reset_mock()
+
+    server.broadcast_stop("msx_test")
+    server.broadcast_stop("msx_test")
+    await asyncio.gather(*tasks)
+
+    assert config_mock.get_value.call_count == 1
+    ws.send_str.assert_awaited_with('{"type":"stop","showNotification":false}')
+    assert ws.send_str.await_count == 2
+
+
+def test_connections_pruned_when_stream_ends(provider: MSXBridgeProvider) -> None:
+    """A player's connection record is dropped once its last stream ends."""
+    server = MSXHTTPServer(provider, 0)
+    task = Mock()
+    transport = Mock()
+    server._register_stream("msx_test", task, transport)
+    assert server._connections["msx_test"].tasks == {task}
+
+    server._unregister_stream("msx_test", task, transport)
+    assert "msx_test" not in server._connections
+
+
+def test_queue_item_duration_cached(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """Reopening the same queue item's stream reuses the resolved duration."""
+    server = MSXHTTPServer(provider, 0)
+    mass_mock.player_queues.get_item = Mock(
+        return_value=Mock(media_item=Mock(duration=215), duration=0)
+    )
+    media = Mock(source_id="msx_test", queue_item_id="qi1")
+
+    assert server._queue_item_duration(media) == 215
+    assert server._queue_item_duration(media) == 215
+    mass_mock.player_queues.get_item.assert_called_once_with("msx_test", "qi1")
+
+
+def test_queue_item_duration_order(
+    provider: MSXBridgeProvider, mass_mock: Mock
+) -> None:
+    """The media item's duration wins, then the fallback, then the queue item's."""
+    server = MSXHTTPServer(provider, 0)
+    queue_item = Mock(media_item=Mock(duration=215), duration=300)
+    mass_mock.player_queues.get_item = Mock(return_value=queue_item)
+
+    with_item, without_item, no_fallback = (
+        Mock(source_id="q", queue_item_id=item_id) for item_id in ("a", "b", "c")
+    )
+
+    assert server._queue_item_duration(with_item, 200) == 215
+    queue_item.media_item = None
+    assert server._queue_item_duration(without_item, 200) == 200
+    assert server._queue_item_duration(no_fallback) == 300
+
+
+def test_cancel_streams_aborts_transports(provider: MSXBridgeProvider) -> None:
+    """Cancelling a player's streams aborts transports and tolerates failures."""
+    server = MSXHTTPServer(provider, 0)
+    task = Mock(done=Mock(return_value=False))
+    transport = Mock(abort=Mock(side_effect=RuntimeError("closed")))
+    server._register_stream("msx_test", task, transport)
+
+    server.cancel_streams_for_player("msx_test")
+
+    task.cancel.assert_called_once()
+    transport.abort.assert_called_once()
+    assert "msx_test" not in server._connections
+
+
+def test_player_id_from_ip_and_device_id(provider: MSXBridgeProvider) -> None:
+    """Player IDs are sanitized from the client IP or the device_id param."""
+    server = MSXHTTPServer(provider, 0)
+    request = make_mocked_request(
+        "GET", "/msx/menu.json", headers={"X-Forwarded-For": "192.168.10.15"}
+    )
+    assert server._get_player_id_and_device_param(request) == (
+        "msx_192_168_10_15",
+        "",
+    )
+
+    request = make_mocked_request("GET", "/msx/menu.json?device_id=ab.cd-12")
+    assert server._get_player_id_and_device_param(request) == (
+        "msx_ab_cd_12",
+        "device_id=ab.cd-12",
+    )
+
+
 class _AsyncCtx:
     """Async context manager helper for mocking session.get()."""
 
@@ -8,7 +8,10 @@ import pytest
 from music_assistant_models.media_items import Album, Track
 
 from music_assistant.providers.msx_bridge.mappers import (
+    format_duration,
+    get_image_url,
     map_album_to_msx,
+    map_artist_to_msx,
     map_track_to_msx,
 )
 from music_assistant.providers.msx_bridge.provider import MSXBridgeProvider
@@ -74,3 +77,58 @@ async def test_map_album_to_msx() -> None:
         item.action
         == "content:http://localhost/msx/albums/1/tracks.json?provider=library&device_id=abc"
     )
+
+
+def test_get_image_url_reads_image_once() -> None:
+    """The (computed) image property should only be evaluated once per item."""
+    prov = _mock_provider()
+    reads: list[int] = []
+
+    class _Item:
+        @property
+        def image(self) -> str:
+            reads.append(1)
+            return "img"
+
+    assert get_image_url(_Item(), prov) == "http://image.url"
+    assert len(reads) == 1
+    prov.mass.metadata.get_image_url.assert_called_once_with("img")
+
+
+def test_map_track_to_msx_search_kind() -> None:
+    """Search results carry a kind label with the artist and a kind icon."""
+    prov = _mock_provider()
+    track = MagicMock(spec=Track)
+    track.name = "Test Track"
+    track.uri = "library://track/1"
+    track.duration = 125
+    track.artist_str = "Test Artist"
+    track.image = None
+
+    item = map_track_to_msx(
+        track, "http://localhost", "msx_123", prov, search_kind="Track"
+    )
+
+    assert item.label == "Track — Test Artist"
+    assert item.icon == "msx-white-soft:audiotrack"
+
+
+def test_format_duration() -> None:
+    """Durations render as m:ss and unknown durations as an empty string."""
+    assert format_duration(222) == "3:42"
+    assert format_duration(65) == "1:05"
+    assert format_duration(0) == ""
+    assert format_duration(222) is format_duration(222)
+
+
+def test_map_artist_to_msx_device_param() -> None:
+    """The device param starts the query string of artist drill-down URLs."""
+    prov = _mock_provider()
+    artist = MagicMock()
+    artist.item_id = "5"
+    artist.name = "Artist"
+    item = map_artist_to_msx(artist, "http://localhost", prov, "device_id=abc")
+    assert (
+        item.action
+        == "content:http://localhost/msx/artists/5/albums.json?device_id=abc"
+    )
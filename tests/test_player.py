@@ -55,6 +55,22 @@ def test_poll_interval_not_playing(player: MSXPlayer) -> None:
     assert player.poll_interval == 30
 
 
+async def test_poll_interval_backs_off_until_state_change(player: MSXPlayer) -> None:
+    """poll_interval grows after a few stable polls and resets on a transition."""
+    player._attr_playback_state = PlaybackState.PLAYING
+    player._attr_elapsed_time = None
+    for _ in range(3):
+        assert player.poll_interval == 5
+        await player.poll()
+    assert player.poll_interval == 30
+
+    await player.pause()
+    assert player.poll_interval == 30
+    for _ in range(3):
+        await player.poll()
+    assert player.poll_interval == 60
+
+
 # --- Playback ---
 
 
@@ -111,6 +127,18 @@ async def test_wait_for_media_fast_path(player: MSXPlayer) -> None:
     assert result is media
 
 
+async def test_wait_for_media_wakes_concurrent_waiters(player: MSXPlayer) -> None:
+    """Every pending wait_for_media call receives the media from one play_media."""
+    media = Mock(spec=PlayerMedia)
+    media.uri = "http://ma-server/stream/12345"
+
+    wait = player.wait_for_media  # type: ignore[attr-defined]
+    waiters = [asyncio.create_task(wait(timeout=2.0)) for _ in range(2)]
+    await asyncio.sleep(0)
+    await player.play_media(media)
+    assert await asyncio.gather(*waiters) == [media, media]
+
+
 async def test_wait_for_media_timeout(player: MSXPlayer) -> None:
     """wait_for_media should return None on timeout."""
     result = await player.wait_for_media(timeout=0.1)  # type: ignore[attr-defined]
@@ -124,6 +152,18 @@ async def test_stop_clears_media_ready_event(player: MSXPlayer) -> None:
     assert not player._media_ready.is_set()  # type: ignore[attr-defined]
 
 
+async def test_has_media_follows_play_and_stop(player: MSXPlayer) -> None:
+    """has_media should be True after play_media and False after stop."""
+    media = Mock(spec=PlayerMedia)
+    media.uri = "http://ma-server/stream/12345"
+
+    assert not player.has_media
+    await player.play_media(media)
+    assert player.has_media
+    await player.stop()
+    assert not player.has_media
+
+
 async def test_play_resume(player: MSXPlayer) -> None:
     """play() when PAUSED should notify MSX to resume and set state to PLAYING."""
     player._attr_playback_state = PlaybackState.PAUSED
@@ -226,6 +266,29 @@ async def test_poll_updates_elapsed(player: MSXPlayer) -> None:
     player.update_state.assert_called()  # type: ignore[attr-defined]
 
 
+async def test_poll_skips_sub_second_drift(player: MSXPlayer) -> None:
+    """poll() right after a state update should not broadcast again."""
+    player._attr_playback_state = PlaybackState.PLAYING
+    player._attr_elapsed_time = 10.0
+    player._attr_elapsed_time_last_updated = 200.0
+    player.update_state.reset_mock()  # type: ignore[attr-defined]
+
+    with patch("music_assistant.providers.msx_bridge.player.time") as mock_time:
+        mock_time.time.return_value = 200.5
+        await player.poll()
+
+    assert player._attr_elapsed_time == 10.0
+    player.update_state.assert_not_called()  # type: ignore[attr-defined]
+
+
+async def test_volume_set_unchanged_skips_update(player: MSXPlayer) -> None:
+    """volume_set with the current level should not broadcast a state update."""
+    await player.volume_set(60)
+    player.update_state.reset_mock()  # type: ignore[attr-defined]
+    await player.volume_set(60)
+    player.update_state.assert_not_called()  # type: ignore[attr-defined]
+
+
 async def test_poll_noop_when_paused(player: MSXPlayer) -> None:
     """poll() should not update anything when paused."""
     player._attr_playback_state = PlaybackState.PAUSED
@@ -271,6 +334,24 @@ async def test_set_members_add_and_remove(provider: Any, mass_mock: Mock) -> Non
     assert "msx_member" not in leader._attr_group_members
 
 
+async def test_set_members_keeps_order_without_duplicates(
+    provider: Any, mass_mock: Mock
+) -> None:
+    """set_members keeps join order and ignores repeated ids in one call."""
+    leader = MSXPlayer(provider, "msx_leader", name="Leader TV", output_format="mp3")
+    leader.update_state = Mock()  # type: ignore[misc,method-assign]
+    members = {
+        pid: MSXPlayer(provider, pid, name=pid, output_format="mp3")
+        for pid in ("msx_a", "msx_b", "msx_c")
+    }
+    mass_mock.players.get = Mock(side_effect=members.get)
+
+    await leader.set_members(player_ids_to_add=["msx_a", "msx_b", "msx_a", "msx_c"])
+    await leader.set_members(player_ids_to_remove=["msx_b"])
+
+    assert leader._attr_group_members == ["msx_a", "msx_c"]
+
+
 async def test_set_members_ignores_self_and_non_msx(
     provider: Any, mass_mock: Mock
 ) -> None:
@@ -511,8 +592,9 @@ async def test_play_media_sends_goto_index_when_playing_from_queue(
 
     mass_mock.player_queues.get.return_value = queue
     mass_mock.player_queues.get_item.return_value = None
-    # Return same size as _playlist_size to avoid "queue changed" re-send
+    # Same items as the sent playlist to avoid a "queue changed" re-send
     mass_mock.player_queues.items.return_value = [Mock()] * 5
+    player._playlist_fingerprint = player._queue_state("msx_test")[1]
 
     with (
         patch.object(player.provider, "notify_goto_index") as mock_goto,
@@ -527,6 +609,51 @@ async def test_play_media_sends_goto_index_when_playing_from_queue(
     mock_play.assert_not_called()
 
 
+def test_queue_state_tracks_order(player: MSXPlayer, mass_mock: Mock) -> None:
+    """Queue fingerprint changes on reorder even though the size stays the same."""
+    items = [Mock(queue_item_id=f"qi{n}") for n in range(3)]
+    mass_mock.player_queues.items.return_value = items
+    size, fingerprint = player._queue_state("msx_test")
+    assert size == 3
+
+    mass_mock.player_queues.items.return_value = items[::-1]
+    assert player._queue_state("msx_test")[0] == 3
+    assert player._queue_state("msx_test")[1] != fingerprint
+
+
+async def test_same_queue_shuffle_resends_playlist(
+    player: MSXPlayer, mass_mock: Mock
+) -> None:
+    """A same-size reorder of the playing queue re-sends the MSX playlist."""
+    items = [Mock(queue_item_id=f"qi{n}") for n in range(3)]
+    mass_mock.player_queues.items.return_value = items
+    mass_mock.player_queues.get.return_value = Mock(current_index=0)
+    mass_mock.player_queues.get_item.return_value = None
+    media = Mock(spec=PlayerMedia)
+    media.uri = "http://ma-server/stream/1"
+    media.source_id = "msx_test"
+    media.queue_item_id = "qi0"
+    with patch.object(player.provider, "notify_play_playlist"):
+        await player.play_media(media)
+
+    mass_mock.player_queues.items.return_value = [items[2], items[0], items[1]]
+    with (
+        patch.object(player.provider, "notify_goto_index") as mock_goto,
+        patch.object(player.provider, "notify_play_playlist") as mock_playlist,
+    ):
+        await player.play_media(media)
+
+    mock_playlist.assert_called_once_with("msx_test", 0, queue_id="msx_test")
+    mock_goto.assert_not_called()
+
+
+async def test_solo_player_skips_propagation(player: MSXPlayer) -> None:
+    """A player without group members never resolves member ids."""
+    with patch.object(player, "_get_group_member_ids") as member_ids:
+        await player.pause()
+    member_ids.assert_not_called()
+
+
 async def test_play_media_skips_ws_when_skip_notify_set(
     player: MSXPlayer, mass_mock: Mock
 ) -> None:
@@ -81,6 +81,20 @@ async def test_unload_stops_server_first(provider: MSXBridgeProvider) -> None:
     provider.mass.players.unregister.assert_awaited_once_with("msx_test")  # type: ignore[attr-defined]
 
 
+async def test_unload_unregisters_past_failures(provider: MSXBridgeProvider) -> None:
+    """A failing unregister is logged and does not skip the other players."""
+    provider.http_server = None
+    players = [Mock(player_id=f"msx_{n}", display_name=f"TV {n}") for n in range(3)]
+    provider.mass.players.all.return_value = players  # type: ignore[attr-defined]
+    provider.mass.players.unregister = AsyncMock(  # type: ignore[method-assign]
+        side_effect=[None, RuntimeError("boom"), None]
+    )
+
+    await provider.unload()
+
+    assert provider.mass.players.unregister.await_count == 3
+
+
 async def test_unload_no_server(provider: MSXBridgeProvider) -> None:
     """Unload should not crash when http_server is None."""
     provider.http_server = None